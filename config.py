@@ -1,5 +1,217 @@
+import atexit
+import gzip
 import logging
 import os
+import queue
+import shutil
+import sqlite3
+import time
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+
+
+# Append-only, close-on-exec, binary (on Windows) descriptor for the log file
+_LOG_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0)
+
+
+class RawFdHandler(logging.Handler):
+    """
+    A logging handler that appends formatted records to a file descriptor with os.write.
+
+    The file is opened once with O_APPEND, and only when the first write happens. Records collect in a byte
+    buffer that is written with a single os.write when a record at or above flush_level arrives, when the
+    buffer reaches buffer_size bytes, when a record arrives flush_interval seconds or more after the last write,
+    and when the handler is flushed or closed. Run it behind an IdleFlushQueueListener so buffered records are
+    also written once logging goes quiet. When max_bytes is set, the file is rotated before a write would grow it
+    past that size: the current file is gzip-compressed to '<filename>.1.gz' and older archives are shifted up
+    to backup_count.
+    """
+
+    terminator = '\n'
+
+    def __init__(self, filename: str, flush_interval: float = 30.0, flush_level: int = logging.ERROR,
+                 buffer_size: int = 65536, encoding: str = 'utf-8', max_bytes: int = 0, backup_count: int = 0):
+        """
+        Initialize the handler without opening the log file.
+
+        Args:
+            filename (str): Path to the log file.
+            flush_interval (float): Seconds after the last write at which the next record triggers a write
+                (default: 30.0).
+            flush_level (int): Records at or above this level are written immediately (default: ERROR).
+            buffer_size (int): Number of buffered bytes that triggers a write (default: 65536).
+            encoding (str): Encoding used for the log file (default: 'utf-8').
+            max_bytes (int): Size in bytes at which the file is rotated; 0 disables rotation (default: 0).
+            backup_count (int): Number of compressed archives to keep (default: 0).
+        """
+        super().__init__()
+        self.baseFilename = os.path.abspath(filename)
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        self.buffer_size = buffer_size
+        self.encoding = encoding
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.fd = None
+        self._size = 0
+        self._buffer = bytearray()
+        self._last_flush = time.monotonic()
+
+    def emit(self, record):
+        """
+        Append a formatted record to the buffer, writing the buffer out only when required.
+
+        Args:
+            record (logging.LogRecord): The record to write.
+        """
+        try:
+            self._buffer += (self.format(record) + self.terminator).encode(self.encoding)
+            now = time.monotonic()
+            if (record.levelno >= self.flush_level or len(self._buffer) >= self.buffer_size
+                    or now - self._last_flush >= self.flush_interval):
+                self._write_buffer()
+                self._last_flush = now
+        except Exception:
+            self.handleError(record)
+
+    def _write_buffer(self):
+        """
+        Write the buffered bytes to the log file, opening it on first use; the caller must hold the handler lock.
+        """
+        if not self._buffer:
+            return
+        if self.fd is None:
+            self.fd = os.open(self.baseFilename, _LOG_OPEN_FLAGS, 0o644)
+            self._size = os.fstat(self.fd).st_size
+        if self.max_bytes and self._size and self._size + len(self._buffer) > self.max_bytes:
+            self._rotate()
+        view = memoryview(self._buffer)
+        while view:
+            view = view[os.write(self.fd, view):]
+        view.release()
+        self._size += len(self._buffer)
+        self._buffer.clear()
+
+    def _rotate(self):
+        """
+        Compress the current log file into the first archive slot and start a new, empty file.
+        """
+        os.close(self.fd)
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f'{self.baseFilename}.{index}.gz'
+            if os.path.exists(source):
+                os.replace(source, f'{self.baseFilename}.{index + 1}.gz')
+        if self.backup_count > 0:
+            with open(self.baseFilename, 'rb') as source, gzip.open(f'{self.baseFilename}.1.gz', 'wb') as dest:
+                shutil.copyfileobj(source, dest)
+        os.remove(self.baseFilename)
+        self.fd = os.open(self.baseFilename, _LOG_OPEN_FLAGS, 0o644)
+        self._size = 0
+
+    def flush(self):
+        """
+        Write any buffered records to the log file.
+        """
+        self.acquire()
+        try:
+            self._write_buffer()
+        finally:
+            self.release()
+
+    def close(self):
+        """
+        Write any buffered records and close the file descriptor.
+        """
+        self.acquire()
+        try:
+            self._write_buffer()
+            if self.fd is not None:
+                os.close(self.fd)
+                self.fd = None
+        finally:
+            self.release()
+        super().close()
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    A Formatter that renders the date and time part of asctime at most once per wall-clock second.
+
+    Records logged within the same second reuse the cached string; only the milliseconds are formatted
+    per record, so the output matches the default asctime format.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        Initialize the formatter with an empty time cache.
+        """
+        super().__init__(*args, **kwargs)
+        self._cached_second = None
+        self._cached_time = ''
+
+    def formatTime(self, record, datefmt=None):
+        """
+        Return the creation time of the record, reusing the cached seconds string when possible.
+
+        Args:
+            record (logging.LogRecord): The record being formatted.
+            datefmt (str): Optional explicit date format; bypasses the cache when given.
+
+        Returns:
+            str: The formatted time, e.g. '2025-05-25 12:31:00,123'.
+        """
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_time = time.strftime(self.default_time_format, self.converter(second))
+            self._cached_second = second
+        return self.default_msec_format % (self._cached_time, record.msecs)
+
+
+class IdleFlushQueueListener(QueueListener):
+    """
+    A QueueListener that flushes its handlers once the queue has been empty for flush_interval seconds.
+
+    Buffering handlers such as RawFdHandler only check their own interval when a record arrives; the listener
+    thread covers the idle case, so records logged just before a quiet period reach the file without waiting
+    for the next record or for interpreter exit.
+    """
+
+    def __init__(self, log_queue, *handlers, flush_interval: float = 30.0):
+        """
+        Initialize the listener.
+
+        Args:
+            log_queue (queue.Queue): Queue the QueueHandler puts records on.
+            *handlers (logging.Handler): Handlers the records are passed to.
+            flush_interval (float): Seconds without a record after which the handlers are flushed (default: 30.0).
+        """
+        super().__init__(log_queue, *handlers)
+        self.flush_interval = flush_interval
+
+    def dequeue(self, block):
+        """
+        Return the next record, flushing the handlers each time the wait for one times out.
+
+        Args:
+            block (bool): Whether to wait for a record.
+
+        Returns:
+            logging.LogRecord: The next record, or the stop sentinel.
+        """
+        if not block:
+            return self.queue.get(False)
+        while True:
+            try:
+                return self.queue.get(True, self.flush_interval)
+            except queue.Empty:  # Must not escape: the monitor loop treats it as the end of the queue
+                for handler in self.handlers:
+                    handler.flush()
+
+
+_logging_configured = False
 
 
 def configure_logging():
@@ -8,19 +220,125 @@ def configure_logging():
 
     Sets up logging to write messages to a file named 'project_management.log' with a specified format.
     The logging level is set to INFO, capturing informational and higher-severity messages.
+    Records are handed to a queue on the caller's thread and written by a background QueueListener,
+    so file I/O stays off the hot path. Repeated calls are no-ops, and the log file is not opened
+    until the first record is written.
     """
+    global _logging_configured
+    if _logging_configured:
+        return
+    _logging_configured = True
+    # The log format uses none of these, so skip looking them up for every record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    # Output logs to a buffered, append-only file, rotated into gzip archives at 8 MiB (5 archives kept)
+    file_handler = RawFdHandler('project_management.log', max_bytes=8 * 1024 * 1024, backup_count=5)
+    # Define log message format: timestamp, level, message
+    file_handler.setFormatter(CachedTimeFormatter('%(asctime)s - %(levelname)s - %(message)s'))
+    log_queue = queue.Queue(-1)  # Unbounded queue between callers and the listener thread
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))  # Only merge args; the file handler formats
+    listener = IdleFlushQueueListener(log_queue, file_handler, flush_interval=file_handler.flush_interval)
+    listener.start()
+    atexit.register(listener.stop)  # Drain the queue and flush the file on interpreter exit
     logging.basicConfig(
         level=logging.INFO,  # Set logging level to INFO
-        format='%(asctime)s - %(levelname)s - %(message)s',  # Define log message format: timestamp, level, message
-        handlers=[
-            logging.FileHandler('project_management.log'),  # Output logs to a file
-        ]
+        handlers=[queue_handler]
     )
 
 
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Return the module-level logger for the given name.
+
+    Loggers should be created once per module and passed %-style arguments (or guarded with
+    logger.isEnabledFor) so messages are only formatted when the record is actually emitted.
+
+    Args:
+        name (str): Logger name, normally the calling module's __name__.
+
+    Returns:
+        logging.Logger: The logger for that name.
+    """
+    return logging.getLogger(name)
+
+
+_HERE = Path(__file__).resolve().parent  # Resolved once at import so consumers never re-resolve the path
+
 # Define the path to the SQLite database file
-DB_PATH = os.path.join(os.path.dirname(__file__), 'logic', 'project_management.db')
+DB_PATH = str(_HERE / 'logic' / 'project_management.db')
 """
 str: The absolute path to the SQLite database file 'project_management.db' located in the 'logic' directory.
-Constructed using the current file's directory to ensure portability.
-"""
\ No newline at end of file
+Constructed using the current file's resolved directory to ensure portability.
+"""
+
+POOL_SIZE = 4
+"""
+int: Number of read-only connections each repository keeps open for concurrent reads.
+"""
+
+STATEMENT_CACHE_SIZE = 256
+"""
+int: Number of prepared statements each database connection keeps cached.
+"""
+
+PRAGMAS = (
+    'PRAGMA synchronous = NORMAL',  # Fsync only at WAL checkpoints
+    'PRAGMA cache_size = -65536',  # 64 MiB page cache per connection
+    'PRAGMA mmap_size = 268435456',  # Memory-map up to 256 MiB of the database file
+    'PRAGMA temp_store = MEMORY',  # Keep temporary tables and sort spills off disk
+    'PRAGMA wal_autocheckpoint = 1000',  # Checkpoint the WAL back into the database every 1000 pages
+    'PRAGMA busy_timeout = 5000',  # Wait up to 5 s for another connection's lock instead of failing at once
+    'PRAGMA foreign_keys = ON',  # Enable foreign key constraints
+)
+"""
+tuple: PRAGMA statements applied once to every long-lived connection when it is opened.
+"""
+
+
+def open_connection(db_path: str) -> sqlite3.Connection:
+    """
+    Open a long-lived connection usable from any thread and apply the shared PRAGMA settings.
+
+    The connection runs in autocommit mode, so the sqlite3 module never issues implicit BEGINs;
+    group writes with txn() instead.
+
+    Args:
+        db_path (str): Path to the SQLite database file.
+
+    Returns:
+        sqlite3.Connection: A configured connection to the database.
+
+    Raises:
+        sqlite3.Error: If the connection cannot be opened.
+    """
+    conn = sqlite3.connect(db_path, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE,
+                           isolation_level=None)  # Autocommit; transactions are opened explicitly with txn()
+    for pragma in PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+@contextmanager
+def txn(conn: sqlite3.Connection):
+    """
+    Run a block of statements in one explicit write transaction.
+
+    Issues BEGIN IMMEDIATE so the write lock is taken up front, then COMMIT when the block succeeds or
+    ROLLBACK when it raises.
+
+    Args:
+        conn (sqlite3.Connection): A connection opened with isolation_level=None.
+
+    Yields:
+        sqlite3.Connection: The same connection, inside the transaction.
+    """
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        yield conn
+    except BaseException:
+        conn.execute('ROLLBACK')
+        raise
+    conn.execute('COMMIT')
@@ -1,30 +1,96 @@
-from abc import ABC, abstractmethod
+from itertools import starmap
+from typing import Any, ClassVar, List, Tuple
+
 from logic.entities import Person, Task, Milestone
 
 
-class BaseEntityFactory(ABC):
-    @abstractmethod
-    def create_entity(self, row: tuple):
+class BaseEntityFactory:
+    _cls: ClassVar[type] = object  # Entity class built by this factory; rows are passed positionally
+    # SQL in the column order the entity expects; reused verbatim so sqlite3's statement cache hits
+    SELECT_ALL: ClassVar[str] = ''
+    SELECT_BY_ID: ClassVar[str] = ''
+    INSERT: ClassVar[str] = ''
+    INSERT_RETURNING: ClassVar[str] = ''  # INSERT that hands back the stored row (SQLite 3.35+)
+    UPDATE: ClassVar[str] = ''  # Partial update: NULL parameters keep the stored value; the id is bound last
+    UPDATE_RETURNING: ClassVar[str] = ''
+    DELETE: ClassVar[str] = ''
+
+    def create_entity(self, row: tuple) -> Any:
         """Create an entity from a database row."""
-        pass
+        raise NotImplementedError
+
+    def create_batch(self, rows: list) -> List[Any]:
+        """Create entities from a list of database rows in a single C-level loop."""
+        return list(starmap(self._cls, rows))
+
+    def row_factory(self, cursor: Any, row: tuple) -> Any:
+        """sqlite3 row_factory hook so the cursor yields entities instead of raw tuples."""
+        return self._cls(*row)
 
 
 class PersonFactory(BaseEntityFactory):
+    _cls = Person
+    SELECT_ALL = 'SELECT id, name, email, role FROM Person'
+    SELECT_BY_ID = SELECT_ALL + ' WHERE id = ?'
+    INSERT = 'INSERT INTO Person (name, email, role) VALUES (?, ?, ?)'
+    INSERT_RETURNING = INSERT + ' RETURNING id, name, email, role'
+    UPDATE = ('UPDATE Person SET name = COALESCE(?, name), email = COALESCE(?, email), role = COALESCE(?, role) '
+              'WHERE id = ?')
+    UPDATE_RETURNING = UPDATE + ' RETURNING id, name, email, role'
+    DELETE = 'DELETE FROM Person WHERE id = ?'
+
     def create_entity(self, row: tuple) -> Person:
-        return Person(id=row[0], name=row[1], email=row[2], role=row[3])
+        return Person(*row)
 
 
 class TaskFactory(BaseEntityFactory):
+    _cls = Task
+    SELECT_ALL = ('SELECT id, title, description, status, priority, start_date, due_date, person_id, milestone_id '
+                  'FROM Task')
+    SELECT_BY_ID = SELECT_ALL + ' WHERE id = ?'
+    INSERT = ('INSERT INTO Task (title, description, status, priority, start_date, due_date, person_id, milestone_id) '
+              'VALUES (?, ?, ?, ?, ?, ?, ?, ?)')
+    INSERT_RETURNING = INSERT + (' RETURNING id, title, description, status, priority, start_date, due_date, '
+                                 'person_id, milestone_id')
+    UPDATE = ('UPDATE Task SET title = COALESCE(?, title), description = COALESCE(?, description), '
+              'status = COALESCE(?, status), priority = COALESCE(?, priority), '
+              'start_date = COALESCE(?, start_date), due_date = COALESCE(?, due_date), '
+              'person_id = COALESCE(?, person_id), milestone_id = COALESCE(?, milestone_id) WHERE id = ?')
+    UPDATE_RETURNING = UPDATE + (' RETURNING id, title, description, status, priority, start_date, due_date, '
+                                 'person_id, milestone_id')
+    DELETE = 'DELETE FROM Task WHERE id = ?'
+    # Task columns followed by the assigned person's and the milestone's names, resolved in one query
+    SELECT_WITH_NAMES = ('SELECT t.id, t.title, t.description, t.status, t.priority, t.start_date, t.due_date, '
+                         't.person_id, t.milestone_id, p.name, m.name FROM Task t '
+                         'LEFT JOIN Person p ON p.id = t.person_id LEFT JOIN Milestone m ON m.id = t.milestone_id')
+    # Plain CSV export rows: task columns with the names in place of the foreign keys
+    SELECT_EXPORT = ('SELECT t.id, t.title, t.description, t.status, t.priority, t.start_date, t.due_date, p.name, '
+                     "COALESCE(m.name, 'None') FROM Task t "
+                     'LEFT JOIN Person p ON p.id = t.person_id LEFT JOIN Milestone m ON m.id = t.milestone_id')
+
     def create_entity(self, row: tuple) -> Task:
-        return Task(id=row[0], title=row[1], description=row[2],
-                    status=row[3], priority=row[4], start_date=row[5],
-                    due_date=row[6], person_id=row[7], milestone_id=row[8])
+        return Task(*row)
+
+    def named_row_factory(self, cursor: Any, row: tuple) -> Tuple[Task, Any, Any]:
+        """sqlite3 row_factory hook for SELECT_WITH_NAMES rows: (task, person name, milestone name)."""
+        return Task(*row[:9]), row[9], row[10]
 
 
 class MilestoneFactory(BaseEntityFactory):
+    _cls = Milestone
+    SELECT_ALL = 'SELECT id, name FROM Milestone'
+    SELECT_BY_ID = SELECT_ALL + ' WHERE id = ?'
+    INSERT = 'INSERT INTO Milestone (name) VALUES (?)'
+    INSERT_RETURNING = INSERT + ' RETURNING id, name'
+    UPDATE = 'UPDATE Milestone SET name = COALESCE(?, name) WHERE id = ?'
+    UPDATE_RETURNING = UPDATE + ' RETURNING id, name'
+    DELETE = 'DELETE FROM Milestone WHERE id = ?'
+
     def create_entity(self, row: tuple) -> Milestone:
-        return Milestone(id=row[0], name=row[1])
+        return Milestone(*row)
 
 
-def load_entity(factory: BaseEntityFactory, row: tuple):
-    return factory.create_entity(row)
+# Factories are stateless, so one shared instance per entity type is reused by all callers
+PERSON_FACTORY = PersonFactory()
+TASK_FACTORY = TaskFactory()
+MILESTONE_FACTORY = MilestoneFactory()
@@ -1,12 +1,41 @@
+import logging
+import queue
 import sqlite3
 import re
-from datetime import datetime
-from typing import List, Optional
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from calendar import isleap
+from typing import Iterator, List, Optional
 from logic.entities import Person, Task, Milestone
-from design_pattern.factory.factory import EntityFactory, load_entity, MilestoneFactory, TaskFactory, PersonFactory
-import logging
+from design_pattern.factory.factory import MILESTONE_FACTORY, TASK_FACTORY, PERSON_FACTORY
+from config import POOL_SIZE, get_logger, open_connection, txn
+
+logger = get_logger(__name__)
+
+
+class _EntityCache(OrderedDict):
+    """
+    An LRU cache of entities keyed by ID that counts its invalidations.
+
+    The generation changes whenever an entry is popped, deleted or cleared, so a loader running outside the
+    repository lock can tell whether the entity it read may already be stale.
+    """
+
+    generation = 0
+
+    def pop(self, key, *default):
+        self.generation += 1
+        return super().pop(key, *default)
+
+    def __delitem__(self, key):
+        self.generation += 1
+        super().__delitem__(key)
 
-logger = logging.getLogger(__name__)
+    def clear(self):
+        self.generation += 1
+        super().clear()
 
 
 class ProjectManagementRepository:
@@ -17,8 +46,43 @@ class ProjectManagementRepository:
 
     VALID_STATUSES = {"ToDo", "InProgress", "Done"}  # Valid task status options
     VALID_PRIORITIES = {"High", "Medium", "Low"}  # Valid task priority options
-    DATE_FORMAT = r'^\d{4}-\d{2}-\d{2}$'  # Regex for YYYY-MM-DD date format
-    EMAIL_FORMAT = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'  # Regex for email validation
+    _DATE_RE = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}')  # YYYY-MM-DD date format, compiled once
+    _EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')  # Email format, compiled once
+    _DAYS_IN_MONTH = (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)  # Indexed by month; Feb 29 checked separately
+    # Whitelisted sort fields mapped to their ORDER BY terms; the Person name term is served by idx_person_name
+    _PERSON_SORT = {"id": "id", "name": "name COLLATE NOCASE", "email": "email", "role": "role"}
+    _TASK_SORT = {"title": "title", "priority": "priority", "person_id": "person_id", "status": "status"}
+    _MILESTONE_TASK_SORT = {"id": "id", "title": "title", "status": "status", "priority": "priority",
+                            "start_date": "start_date", "due_date": "due_date"}
+    _MILESTONE_SORT = {"name": "name COLLATE NOCASE"}
+    # Full list queries per sort field, built once so every call reuses the same statement-cache entry
+    _PERSON_LIST_SQL = {field: f'{PERSON_FACTORY.SELECT_ALL} ORDER BY {term}' for field, term in _PERSON_SORT.items()}
+    _TASK_LIST_SQL = {field: f'{TASK_FACTORY.SELECT_ALL} ORDER BY {term}' for field, term in _TASK_SORT.items()}
+    _TASK_NAMED_SQL = {field: f'{TASK_FACTORY.SELECT_WITH_NAMES} ORDER BY t.{term}'
+                       for field, term in _TASK_SORT.items()}
+    _TASK_EXPORT_SQL = {field: f'{TASK_FACTORY.SELECT_EXPORT} ORDER BY t.{term}' for field, term in _TASK_SORT.items()}
+    _MILESTONE_LIST_SQL = {field: f'{MILESTONE_FACTORY.SELECT_ALL} ORDER BY {term}'
+                           for field, term in _MILESTONE_SORT.items()}
+    # Every shape of the per-milestone task query, keyed by (status filtered, priority filtered, sort field)
+    _MILESTONE_TASK_SQL = {
+        (by_status, by_priority, field): (f"{TASK_FACTORY.SELECT_ALL} WHERE milestone_id = ?"
+                                          f"{' AND status = ?' if by_status else ''}"
+                                          f"{' AND priority = ?' if by_priority else ''} ORDER BY {term}")
+        for field, term in _MILESTONE_TASK_SORT.items() for by_status in (False, True) for by_priority in (False, True)}
+    # Existence checks by (table, column), prebuilt so each one reuses its statement-cache entry
+    _FK_QUERIES = {
+        ("Person", "id"): 'SELECT 1 FROM Person WHERE id = ?',
+        ("Milestone", "id"): 'SELECT 1 FROM Milestone WHERE id = ?',
+        ("Task", "id"): 'SELECT 1 FROM Task WHERE id = ?',
+    }
+    CACHE_SIZE = 4096  # Maximum number of entities kept per fetch-by-id cache
+    FK_CACHE_SIZE = 512  # Maximum number of confirmed foreign key targets remembered
+    ITER_BATCH_SIZE = 1000  # Rows fetched per round trip by the iter_* generators
+    RETURNING_SUPPORTED = sqlite3.sqlite_version_info >= (3, 35, 0)  # INSERT ... RETURNING needs SQLite 3.35+
+    MAX_SQL_PARAMS = 999  # SQLite's default cap on bound parameters per statement
+    READ_POOL_SIZE = POOL_SIZE  # Read-only connections, so that many background reads run at once
+    CLOSE_TIMEOUT = 5.0  # Seconds close() waits for borrowed readers before leaving them to close on return
+    _UNSHARED = nullcontext()  # "Lock" for a pooled reader, which only its borrower uses
 
     def __init__(self, db_path: str):
         """
@@ -28,26 +92,197 @@ class ProjectManagementRepository:
             db_path (str): Path to the SQLite database file.
         """
         self.db_path = db_path
-        self._initialize_database()
-
-    def _get_connection(self):
+        self._lock = threading.RLock()  # Serializes use of the write connection across threads
+        self._conn = self._open_connection()
+        self._closed = False
+        self._pool_lock = threading.Lock()  # Orders returning a reader against close() draining the pool
+        self._atomic_owner = None  # Ident of the thread inside atomic(), whose reads must see its own writes
+        self._initialize_database()  # Creates the schema and switches the file to WAL before the reader opens
+        self._readers = None  # For ':memory:', where a second connection would open a separate, empty database
+        if db_path != ':memory:':
+            # Under WAL the readers run beside each other and beside the writer
+            self._readers = queue.Queue()
+            for _ in range(self.READ_POOL_SIZE):
+                conn = self._open_connection()
+                conn.execute('PRAGMA query_only = ON')  # Reject writes on read connections
+                self._readers.put(conn)
+        # Read-through LRU caches for fetch-by-id, least recently used first; entities are frozen, so cached
+        # instances can be shared safely
+        self._person_cache = _EntityCache()
+        self._task_cache = _EntityCache()
+        self._milestone_cache = _EntityCache()
+        self._fk_cache = OrderedDict()  # (table, column, value) keys known to exist, least recently used first
+
+    def _open_connection(self) -> sqlite3.Connection:
         """
-        Establish a connection to the SQLite database with foreign key support enabled.
+        Open one of the repository's long-lived connections with foreign key support enabled.
 
         Returns:
-            sqlite3.Connection: A connection object to the database.
+            sqlite3.Connection: An autocommit connection to the database.
 
         Raises:
             sqlite3.Error: If the connection fails.
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.execute('PRAGMA foreign_keys = ON')  # Enable foreign key constraints
-            return conn
+            return open_connection(self.db_path)  # Applies the per-connection PRAGMAs from config.PRAGMAS
         except sqlite3.Error as e:
-            logger.error(f"Database connection error: {e}")
+            logger.error("Database connection error: %s", e)
             raise sqlite3.Error(f"Database connection error: {e}")
 
+    @contextmanager
+    def _get_connection(self):
+        """
+        Borrow the write connection, holding the repository lock for the duration of the block.
+
+        Yields:
+            sqlite3.Connection: The read-write connection opened in __init__.
+        """
+        with self._lock:
+            yield self._conn
+
+    @contextmanager
+    def _read_session(self):
+        """
+        Borrow a connection for a read, together with the lock that guards each use of it.
+
+        Reads take a read-only connection from the pool, so they do not wait for writes or for each other,
+        except inside an atomic() block, where the calling thread must see its own uncommitted changes, and
+        for in-memory databases; both use the write connection under the repository lock.
+
+        Yields:
+            tuple: (sqlite3.Connection, lock) to use for the read.
+        """
+        if self._readers is None or self._atomic_owner == threading.get_ident():
+            yield self._conn, self._lock
+            return
+        if self._closed:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+        conn = self._readers.get()  # Waits if every reader is borrowed
+        try:
+            yield conn, self._UNSHARED
+        finally:
+            with self._pool_lock:
+                if self._closed:
+                    conn.close()  # Borrowed past close(), so it is not pooled again
+                else:
+                    self._readers.put(conn)
+
+    @contextmanager
+    def _get_read_connection(self):
+        """
+        Borrow a connection for a read, holding its lock for the duration of the block.
+
+        Yields:
+            sqlite3.Connection: A read-only connection, or the write connection inside atomic().
+        """
+        with self._read_session() as (conn, lock), lock:
+            yield conn
+
+    def close(self):
+        """
+        Close the database connections, waiting up to CLOSE_TIMEOUT seconds for borrowed readers to be returned.
+
+        An iter_all_* generator keeps its reader borrowed until it is exhausted or closed, so callers should do
+        one or the other first. Readers still borrowed when the wait runs out are closed as they are returned.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            if self._readers is not None:
+                deadline = time.monotonic() + self.CLOSE_TIMEOUT
+                returned = 0
+                try:
+                    while returned < self.READ_POOL_SIZE:
+                        self._readers.get(timeout=max(deadline - time.monotonic(), 0)).close()
+                        returned += 1
+                except queue.Empty:
+                    logger.warning("Closing with %s read connections still borrowed by unfinished iterators",
+                                   self.READ_POOL_SIZE - returned)
+            with self._pool_lock:
+                self._closed = True
+                while self._readers is not None and not self._readers.empty():
+                    self._readers.get_nowait().close()  # Returned after the wait timed out
+            self._conn.close()
+
+    @contextmanager
+    def atomic(self):
+        """
+        Group any number of repository calls into one write transaction.
+
+        The block holds the repository lock, so other threads cannot interleave statements, and the
+        changes are committed once when it exits (one fsync) or rolled back if it raises. Nested
+        atomic() blocks join the outermost transaction.
+
+        Yields:
+            ProjectManagementRepository: This repository.
+
+        Raises:
+            sqlite3.Error: If the transaction cannot be started or committed.
+        """
+        with self._lock:
+            if self._conn.in_transaction:
+                yield self
+                return
+            self._atomic_owner = threading.get_ident()
+            try:
+                with txn(self._conn):
+                    yield self
+            except BaseException:
+                self.clear_caches()  # Entities cached inside the block may have been rolled back
+                raise
+            finally:
+                self._atomic_owner = None
+
+    def clear_caches(self):
+        """
+        Drop every cached entity, e.g. after another process has written to the database.
+        """
+        with self._lock:
+            self._person_cache.clear()
+            self._task_cache.clear()
+            self._milestone_cache.clear()
+            self._fk_cache.clear()
+
+    def _cached(self, cache: _EntityCache, entity_id: int, fetch):
+        """
+        Return an entity from an LRU cache, loading and caching it on a miss.
+
+        The entity is loaded outside the lock and cached only if nothing was invalidated meanwhile.
+
+        Args:
+            cache (_EntityCache): The entity type's cache, keyed by ID.
+            entity_id (int): ID of the entity.
+            fetch: Loader called with entity_id on a miss.
+
+        Returns:
+            The cached or freshly loaded entity.
+        """
+        with self._lock:
+            entity = cache.get(entity_id)
+            if entity is not None:
+                cache.move_to_end(entity_id)
+                return entity
+            generation = cache.generation
+        entity = fetch(entity_id)  # Slow reads must not block writers or cache hits
+        with self._lock:
+            if cache.generation == generation:  # An update or delete since the read may have made it stale
+                cache[entity_id] = entity
+                if len(cache) > self.CACHE_SIZE:
+                    cache.popitem(last=False)  # Evict the least recently used entry
+        return entity
+
+    def _forget_tasks(self, column: str, value: int):
+        """
+        Drop cached tasks whose column holds the given value, after a cascade changed them.
+
+        Args:
+            column (str): Task attribute to match, "person_id" or "milestone_id".
+            value (int): Value the attribute must hold.
+        """
+        with self._lock:
+            for task_id in [task.id for task in self._task_cache.values() if getattr(task, column) == value]:
+                del self._task_cache[task_id]
+
     def _initialize_database(self):
         """
         Create the necessary tables (Person, Milestone, Task) in the database if they don't exist.
@@ -58,12 +293,15 @@ class ProjectManagementRepository:
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
+                # WAL lets readers run beside the writer; the mode is stored in the file, so switch it only once
+                if cursor.execute('PRAGMA journal_mode').fetchone()[0] != 'wal':
+                    cursor.execute('PRAGMA journal_mode = WAL')
                 # Create Person table with id, name, email, and role
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS Person (
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
                         name TEXT NOT NULL,
-                        email TEXT NOT NULL UNIQUE,
+                        email TEXT NOT NULL UNIQUE CHECK (email LIKE '%_@_%._%'),
                         role TEXT 
                     )
                 ''')
@@ -76,27 +314,58 @@ class ProjectManagementRepository:
                     )
                 ''')
                 # Create Task table with foreign keys to Person and Milestone
+                # Date CHECKs: the '+0 days' modifier normalizes impossible days such as 02-30, so they fail the IS test
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS Task (
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
                         title TEXT NOT NULL,
                         description TEXT,
-                        status TEXT,
-                        priority TEXT,
-                        start_date TEXT,
-                        due_date TEXT,
+                        status TEXT CHECK (status IN ('ToDo', 'InProgress', 'Done')),
+                        priority TEXT CHECK (priority IN ('High', 'Medium', 'Low')),
+                        start_date TEXT CHECK (date(start_date, '+0 days') IS start_date),
+                        due_date TEXT CHECK (date(due_date, '+0 days') IS due_date),
                         person_id INTEGER,
                         milestone_id INTEGER,
                         FOREIGN KEY (person_id) REFERENCES Person(id) ON DELETE CASCADE,
                         FOREIGN KEY (milestone_id) REFERENCES Milestone(id) ON DELETE SET NULL
                     )
                 ''')
-                conn.commit()
+                # Indexes backing the case-insensitive name sorts, the task list sorts, and the per-milestone and
+                # filtered task queries; idx_task_person also serves the foreign key check when a person is deleted
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_person_name ON Person(name COLLATE NOCASE)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_milestone_name ON Milestone(name COLLATE NOCASE)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_task_title ON Task(title)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_task_person ON Task(person_id)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_task_milestone_due ON Task(milestone_id, due_date)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_task_ms_st_pr_dd '
+                               'ON Task(milestone_id, status, priority, due_date)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_task_status ON Task(status)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_task_priority ON Task(priority)')
+                if logger.isEnabledFor(logging.DEBUG):
+                    self._audit_query_plans()
                 logger.info("Database initialized successfully")
         except sqlite3.Error as e:
-            logger.error(f"Database initialization error: {e}")
+            logger.error("Database initialization error: %s", e)
             raise sqlite3.Error(f"Database initialization error: {e}")
 
+    def _audit_query_plans(self):
+        """
+        Log a warning for every filtered hot statement whose query plan scans a table without an index.
+
+        Only run in debug mode; it exists to catch a new WHERE clause added without a matching index.
+        """
+        statements = [*self._PERSON_LIST_SQL.values(), *self._TASK_LIST_SQL.values(),
+                      *self._MILESTONE_LIST_SQL.values(), *self._MILESTONE_TASK_SQL.values(),
+                      *self._FK_QUERIES.values(), PERSON_FACTORY.SELECT_BY_ID, TASK_FACTORY.SELECT_BY_ID,
+                      MILESTONE_FACTORY.SELECT_BY_ID]
+        with self._get_connection() as conn:
+            for sql in statements:
+                # Placeholders only need a value to be planned; NULL works for every column
+                for *_, detail in conn.execute(f'EXPLAIN QUERY PLAN {sql}', (None,) * sql.count('?')):
+                    if ' WHERE ' in sql and detail.startswith('SCAN') and 'INDEX' not in detail:
+                        logger.warning("Unindexed table scan (%s) in query: %s", detail, sql)
+        logger.debug("Audited query plans of %s statements", len(statements))
+
     def _validate_email(self, email: str):
         """
         Validate that the provided email matches the expected format.
@@ -107,7 +376,7 @@ class ProjectManagementRepository:
         Raises:
             ValueError: If the email format is invalid.
         """
-        if not re.match(self.EMAIL_FORMAT, email):
+        if not self._EMAIL_RE.fullmatch(email):
             raise ValueError(f"Invalid email format: {email}")
 
     def _validate_date(self, date_str: str):
@@ -120,11 +389,12 @@ class ProjectManagementRepository:
         Raises:
             ValueError: If the date format is invalid or the date is not valid.
         """
-        if not re.match(self.DATE_FORMAT, date_str):
+        if not isinstance(date_str, str) or not self._DATE_RE.fullmatch(date_str):
             raise ValueError(f"Invalid date format: {date_str}. Use YYYY-MM-DD")
-        try:
-            datetime.strptime(date_str, "%Y-%m-%d")
-        except ValueError:
+        # The regex has fixed the layout, so the fields can be sliced out instead of re-parsed by strptime
+        year, month, day = int(date_str[:4]), int(date_str[5:7]), int(date_str[8:])
+        if (not year or not 1 <= month <= 12 or not 1 <= day <= self._DAYS_IN_MONTH[month]
+                or (month == 2 and day == 29 and not isleap(year))):
             raise ValueError(f"Invalid date: {date_str}")
 
     def _validate_status(self, status: str):
@@ -153,28 +423,249 @@ class ProjectManagementRepository:
         if priority not in self.VALID_PRIORITIES:
             raise ValueError(f"Invalid priority: {priority}. Must be one of {self.VALID_PRIORITIES}")
 
-    def _validate_foreign_key(self, table: str, column: str, value: int) -> bool:
+    def _validate_foreign_key(self, table: str, column: str, value: int, cache: bool = True) -> bool:
         """
         Check if a record exists in the specified table with the given column value.
 
+        Confirmed records are remembered in a bounded LRU cache, so repeated checks against the same row
+        skip the query; missing records are never cached.
+
         Args:
             table (str): Name of the table to check.
             column (str): Column name to check.
             value (int): Value to look for.
+            cache (bool): Whether to consult and fill the cache (default: True).
 
         Returns:
             bool: True if the record exists.
 
         Raises:
             LookupError: If no record is found.
+            KeyError: If (table, column) is not one of the pairs in _FK_QUERIES.
         """
+        key = (table, column, value)
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(f'SELECT 1 FROM {table} WHERE {column} = ?', (value,))
-            if not cursor.fetchone():
+            if cache and key in self._fk_cache:
+                self._fk_cache.move_to_end(key)
+                return True
+            if not conn.execute(self._FK_QUERIES[(table, column)], (value,)).fetchone():
                 raise LookupError(f"No {table} found with {column} = {value}")
+            if cache:
+                self._fk_cache[key] = True
+                if len(self._fk_cache) > self.FK_CACHE_SIZE:
+                    self._fk_cache.popitem(last=False)  # Evict the least recently used entry
             return True
 
+    def _forget_foreign_key(self, table: str, value: Optional[int] = None):
+        """
+        Drop cached existence checks for a deleted row, or for every row of a table when value is None.
+
+        Args:
+            table (str): Name of the table the row was deleted from.
+            value (Optional[int]): ID of the deleted row (optional).
+        """
+        with self._lock:
+            if value is not None:
+                self._fk_cache.pop((table, "id", value), None)
+            else:
+                for key in [key for key in self._fk_cache if key[0] == table]:
+                    del self._fk_cache[key]
+
+    def _insert_entity(self, factory, params: tuple):
+        """
+        Insert one row and build its entity from what SQLite actually stored.
+
+        Uses INSERT ... RETURNING where available, falling back to cursor.lastrowid plus the given parameters
+        on older SQLite versions.
+
+        Args:
+            factory: Entity factory providing the INSERT statements and the entity class.
+            params (tuple): Parameters for the factory's INSERT, in column order without the id.
+
+        Returns:
+            The created entity.
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            if self.RETURNING_SUPPORTED:
+                cursor.row_factory = factory.row_factory
+                # fetchall() runs the statement to completion so its implicit transaction ends here
+                entity, = cursor.execute(factory.INSERT_RETURNING, params).fetchall()
+                return entity
+            cursor.execute(factory.INSERT, params)
+            return factory.create_entity((cursor.lastrowid, *params))
+
+    def _update_entity(self, factory, params: tuple, entity_id: int):
+        """
+        Apply a partial update in one statement and return the row as stored afterwards.
+
+        Args:
+            factory: Entity factory providing the UPDATE statements and the entity class.
+            params (tuple): New column values in the factory's UPDATE order; None keeps the stored value.
+            entity_id (int): ID of the row to update.
+
+        Returns:
+            The updated entity, or None if no row has the given ID.
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = factory.row_factory
+            if self.RETURNING_SUPPORTED:
+                rows = cursor.execute(factory.UPDATE_RETURNING, (*params, entity_id)).fetchall()
+                return rows[0] if rows else None
+            cursor.execute(factory.UPDATE, (*params, entity_id))
+            if not cursor.rowcount:
+                return None
+            return cursor.execute(factory.SELECT_BY_ID, (entity_id,)).fetchone()
+
+    def _get_many(self, factory, ids: List[int], label: str) -> list:
+        """
+        Load the entities for a list of IDs with one IN (...) query per MAX_SQL_PARAMS IDs.
+
+        Args:
+            factory: Entity factory providing SELECT_ALL and the row_factory.
+            ids (List[int]): IDs to load; duplicates are allowed.
+            label (str): Entity name used in error messages.
+
+        Returns:
+            list: The entities, in the order of ids.
+
+        Raises:
+            LookupError: If any of the IDs does not exist.
+            sqlite3.Error: If a database error occurs.
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        found = {}
+        try:
+            with self._get_read_connection() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = factory.row_factory
+                for start in range(0, len(unique_ids), self.MAX_SQL_PARAMS):
+                    chunk = unique_ids[start:start + self.MAX_SQL_PARAMS]
+                    cursor.execute(f"{factory.SELECT_ALL} WHERE id IN ({', '.join('?' * len(chunk))})", chunk)
+                    found.update((entity.id, entity) for entity in cursor)
+        except sqlite3.Error as e:
+            logger.error("%s retrieval error: %s", label, e)
+            raise sqlite3.Error(f"{label} retrieval error: {e}")
+        missing = [entity_id for entity_id in unique_ids if entity_id not in found]
+        if missing:
+            logger.warning("%s with ids %s not found", label, missing)
+            raise LookupError(f"{label} with ids {missing} not found")
+        logger.info("Retrieved %s %s rows by id", len(found), label)
+        return [found[entity_id] for entity_id in ids]
+
+    def _insert_rows(self, insert_sql: str, rows: List[tuple]) -> List[int]:
+        """
+        Insert many rows with multi-row INSERT statements, each bound to at most MAX_SQL_PARAMS parameters.
+
+        Must run inside atomic(), which holds the write lock, so the ids SQLite assigns to each statement's
+        rows are consecutive and end at its lastrowid.
+
+        Args:
+            insert_sql (str): Single-row INSERT statement, e.g. a factory's INSERT.
+            rows (List[tuple]): Parameter tuples, all of the same length as the statement's placeholders.
+
+        Returns:
+            List[int]: Ids of the inserted rows, in input order.
+        """
+        head, values = insert_sql.rsplit(' VALUES ', 1)
+        chunk_size = self.MAX_SQL_PARAMS // len(rows[0])
+        ids = []
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            for start in range(0, len(rows), chunk_size):
+                chunk = rows[start:start + chunk_size]
+                # Full chunks share one SQL string, so only the tail chunk misses the statement cache
+                cursor.execute(f"{head} VALUES {', '.join([values] * len(chunk))}",
+                               [param for row in chunk for param in row])
+                ids.extend(range(cursor.lastrowid - len(chunk) + 1, cursor.lastrowid + 1))
+        return ids
+
+    def _delete_rows(self, factory, ids: List[int], label: str) -> List[int]:
+        """
+        Delete the rows for a list of IDs in one transaction, with one IN (...) statement per MAX_SQL_PARAMS IDs.
+
+        Args:
+            factory: Entity factory providing the single-row DELETE statement.
+            ids (List[int]): IDs to delete; duplicates are allowed.
+            label (str): Entity name used in error messages.
+
+        Returns:
+            List[int]: The distinct deleted IDs, in input order.
+
+        Raises:
+            LookupError: If any of the IDs does not exist; nothing is deleted.
+            sqlite3.Error: If the deletion fails; nothing is deleted.
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        if not unique_ids:
+            return []
+        head = factory.DELETE.rsplit(' = ?', 1)[0]  # 'DELETE FROM <table> WHERE id'
+        try:
+            with self.atomic(), self._get_connection() as conn:
+                # Checked inside the write transaction, so no other writer can add or remove rows before the DELETE
+                self._get_many(factory, unique_ids, label)  # Raises LookupError naming any missing IDs
+                cursor = conn.cursor()
+                for start in range(0, len(unique_ids), self.MAX_SQL_PARAMS):
+                    chunk = unique_ids[start:start + self.MAX_SQL_PARAMS]
+                    cursor.execute(f"{head} IN ({', '.join('?' * len(chunk))})", chunk)
+        except sqlite3.Error as e:
+            logger.error("%s deletion error: %s", label, e)
+            raise sqlite3.Error(f"{label} deletion error: {e}")
+        return unique_ids
+
+    def _iter_entities(self, factory, query: str, label: str) -> Iterator:
+        """
+        Yield the entities returned by a query, fetching ITER_BATCH_SIZE rows at a time.
+
+        Args:
+            factory: Entity factory whose row_factory builds the rows.
+            query (str): SELECT statement in the factory's column order.
+            label (str): Entity name used in error messages.
+
+        Returns:
+            Iterator: Entities built by the factory, in query order.
+        """
+        return self._iter_rows(query, label, factory.row_factory)
+
+    def _iter_rows(self, query: str, label: str, row_factory=None) -> Iterator:
+        """
+        Yield the rows returned by a query, fetching ITER_BATCH_SIZE rows at a time.
+
+        A pooled reader stays borrowed until the iteration ends. When the write connection is used instead,
+        its lock is held only while a batch is fetched, so other callers can use it while the consumer works
+        through the current batch.
+
+        Args:
+            query (str): SELECT statement.
+            label (str): Entity name used in error messages.
+            row_factory: Optional sqlite3 row_factory hook; plain tuples are yielded without one.
+
+        Yields:
+            Rows built by row_factory, in query order.
+
+        Raises:
+            sqlite3.Error: If a database error occurs.
+        """
+        try:
+            with self._read_session() as (conn, lock):
+                with lock:
+                    cursor = conn.cursor()
+                    cursor.row_factory = row_factory
+                    cursor.execute(query)
+                try:
+                    while True:
+                        with lock:
+                            rows = cursor.fetchmany(self.ITER_BATCH_SIZE)
+                        if not rows:
+                            return
+                        yield from rows
+                finally:
+                    cursor.close()
+        except sqlite3.Error as e:
+            logger.error("%s list retrieval error: %s", label, e)
+            raise sqlite3.Error(f"{label} list retrieval error: {e}")
+
     # Person CRUD Operations
     def add_person(self, name: str, email: str, role: str or None) -> Person:
         """
@@ -193,21 +684,45 @@ class ProjectManagementRepository:
         """
         self._validate_email(email)
         try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('INSERT INTO Person (name, email, role) VALUES (?, ?, ?)', (name, email, role))
-                conn.commit()
-                # person = EntityFactory.create_person((cursor.lastrowid, name, email, role))
-                person = load_entity(PersonFactory(), (cursor.lastrowid, name, email, role))
-                logger.info(f"Added person: {person}")
-                return person
+            person = self._insert_entity(PERSON_FACTORY, (name, email, role))
+            logger.info("Added person: %s", person)
+            return person
+        except sqlite3.IntegrityError as e:
+            logger.error("Person insertion error: %s", e)
+            raise sqlite3.Error(f"Person insertion error: {e}")
+
+    def add_persons(self, rows: List[tuple]) -> List[Person]:
+        """
+        Add many persons in a single transaction.
+
+        Args:
+            rows (List[tuple]): (name, email, role) tuples, in the argument order of add_person.
+
+        Returns:
+            List[Person]: The created Person objects, in input order.
+
+        Raises:
+            ValueError: If any email is invalid; nothing is inserted.
+            sqlite3.Error: If the insertion fails (e.g., due to duplicate email); nothing is inserted.
+        """
+        rows = [tuple(row) for row in rows]
+        if not rows:
+            return []
+        for _, email, _ in rows:
+            self._validate_email(email)
+        try:
+            with self.atomic():
+                ids = self._insert_rows(PERSON_FACTORY.INSERT, rows)
         except sqlite3.IntegrityError as e:
-            logger.error(f"Person insertion error: {e}")
+            logger.error("Person insertion error: %s", e)
             raise sqlite3.Error(f"Person insertion error: {e}")
+        persons = PERSON_FACTORY.create_batch([(person_id, *row) for person_id, row in zip(ids, rows)])
+        logger.info("Added %s persons", len(persons))
+        return persons
 
     def get_person(self, person_id: int) -> Optional[Person]:
         """
-        Retrieve a person by their ID.
+        Retrieve a person by their ID, served from an in-memory cache after the first lookup.
 
         Args:
             person_id (int): ID of the person to retrieve.
@@ -219,20 +734,41 @@ class ProjectManagementRepository:
             LookupError: If no person is found with the given ID.
             sqlite3.Error: If a database error occurs.
         """
+        return self._cached(self._person_cache, person_id, self._fetch_person)
+
+    def get_persons(self, person_ids: List[int]) -> List[Person]:
+        """
+        Retrieve many persons by ID with a single query instead of one get_person call each.
+
+        Args:
+            person_ids (List[int]): IDs of the persons to retrieve.
+
+        Returns:
+            List[Person]: The Person objects, in the order of person_ids.
+
+        Raises:
+            LookupError: If any of the IDs does not exist.
+            sqlite3.Error: If a database error occurs.
+        """
+        return self._get_many(PERSON_FACTORY, person_ids, "Person")
+
+    def _fetch_person(self, person_id: int) -> Person:
+        """
+        Load a person by ID from the database, bypassing the cache.
+        """
         try:
-            with self._get_connection() as conn:
+            with self._get_read_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute('SELECT * FROM Person WHERE id = ?', (person_id,))
-                row = cursor.fetchone()
-                if not row:
-                    logger.warning(f"Person with id {person_id} not found")
+                cursor.row_factory = PERSON_FACTORY.row_factory
+                cursor.execute(PERSON_FACTORY.SELECT_BY_ID, (person_id,))
+                person = cursor.fetchone()
+                if not person:
+                    logger.warning("Person with id %s not found", person_id)
                     raise LookupError(f"Person with id {person_id} not found")
-                # person = EntityFactory.create_person(row)
-                person = load_entity(PersonFactory(), row)
-                logger.info(f"Retrieved person: {person}")
+                logger.info("Retrieved person: %s", person)
                 return person
         except sqlite3.Error as e:
-            logger.error(f"Person retrieval error: {e}")
+            logger.error("Person retrieval error: %s", e)
             raise sqlite3.Error(f"Person retrieval error: {e}")
 
     def update_person(self, person_id: int, name: str, email: str, role: Optional[str] = None) -> Person:
@@ -252,23 +788,22 @@ class ProjectManagementRepository:
             LookupError: If no person is found with the given ID.
             sqlite3.Error: If the update fails (e.g., due to duplicate email).
         """
-        person = self.get_person(person_id)
-        name = name or person.name
-        email = email or person.email
-        role = role or person.role
-        self._validate_email(email)
+        if email:
+            self._validate_email(email)
         try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('UPDATE Person SET name = ?, email = ? , role=? WHERE id = ?',
-                               (name, email, role, person_id))
-                conn.commit()
-                updated_person = Person(id=person_id, name=name, email=email, role=role)
-                logger.info(f"Updated person: {updated_person}")
-                return updated_person
+            # Empty values keep the stored ones, as COALESCE only skips NULL
+            updated_person = self._update_entity(PERSON_FACTORY, (name or None, email or None, role or None),
+                                                 person_id)
         except sqlite3.IntegrityError as e:
-            logger.error(f"Person update error: {e}")
+            logger.error("Person update error: %s", e)
             raise sqlite3.Error(f"Person update error: {e}")
+        if updated_person is None:
+            logger.warning("Person with id %s not found", person_id)
+            raise LookupError(f"Person with id {person_id} not found")
+        with self._lock:
+            self._person_cache.pop(person_id, None)
+        logger.info("Updated person: %s", updated_person)
+        return updated_person
 
     def delete_person(self, person_id: int):
         """
@@ -281,17 +816,41 @@ class ProjectManagementRepository:
             LookupError: If no person is found with the given ID.
             sqlite3.Error: If the deletion fails.
         """
-        self._validate_foreign_key("Person", "id", person_id)
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute('DELETE FROM Person WHERE id = ?', (person_id,))
-                conn.commit()
-                logger.info(f"Deleted person with id {person_id}")
+                cursor.execute(PERSON_FACTORY.DELETE, (person_id,))
+                self._person_cache.pop(person_id, None)
+                self._forget_tasks("person_id", person_id)  # The person's tasks are removed by ON DELETE CASCADE
+                self._forget_foreign_key("Person", person_id)
+                self._forget_foreign_key("Task")
+                if cursor.rowcount == 0:  # Caches are pruned first: another writer may have removed the row
+                    raise LookupError(f"No Person found with id = {person_id}")
+                logger.info("Deleted person with id %s", person_id)
         except sqlite3.Error as e:
-            logger.error(f"Person deletion error: {e}")
+            logger.error("Person deletion error: %s", e)
             raise sqlite3.Error(f"Person deletion error: {e}")
 
+    def delete_persons(self, person_ids: List[int]):
+        """
+        Delete many persons in a single transaction.
+
+        Args:
+            person_ids (List[int]): IDs of the persons to delete.
+
+        Raises:
+            LookupError: If any of the IDs does not exist; nothing is deleted.
+            sqlite3.Error: If the deletion fails; nothing is deleted.
+        """
+        deleted_ids = self._delete_rows(PERSON_FACTORY, person_ids, "Person")
+        with self._lock:
+            for person_id in deleted_ids:
+                self._person_cache.pop(person_id, None)
+                self._forget_tasks("person_id", person_id)  # The persons' tasks are removed by ON DELETE CASCADE
+                self._forget_foreign_key("Person", person_id)
+            self._forget_foreign_key("Task")
+        logger.info("Deleted %s persons", len(deleted_ids))
+
     def get_all_persons(self, sort_by: str = "name") -> List[Person]:
         """
         Retrieve all persons, sorted by the specified field.
@@ -306,20 +865,39 @@ class ProjectManagementRepository:
             ValueError: If the sort field is invalid.
             sqlite3.Error: If a database error occurs.
         """
-        valid_sort_fields = {"id", "name", "email", "role"}
-        if sort_by not in valid_sort_fields:
-            raise ValueError(f"Invalid sort field: {sort_by}. Must be one of {valid_sort_fields}")
+        if sort_by not in self._PERSON_SORT:
+            raise ValueError(f"Invalid sort field: {sort_by}. Must be one of {set(self._PERSON_SORT)}")
         try:
-            with self._get_connection() as conn:
+            with self._get_read_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(f'SELECT * FROM Person ORDER BY {sort_by}')
-                persons = [load_entity(PersonFactory(), row) for row in cursor.fetchall()]
-                logger.info(f"Retrieved {len(persons)} persons, sorted by {sort_by}")
+                cursor.row_factory = PERSON_FACTORY.row_factory
+                cursor.execute(self._PERSON_LIST_SQL[sort_by])
+                persons = cursor.fetchall()
+                logger.info("Retrieved %s persons, sorted by %s", len(persons), sort_by)
                 return persons
         except sqlite3.Error as e:
-            logger.error(f"Person list retrieval error: {e}")
+            logger.error("Person list retrieval error: %s", e)
             raise sqlite3.Error(f"Person list retrieval error: {e}")
 
+    def iter_all_persons(self, sort_by: str = "name") -> Iterator[Person]:
+        """
+        Stream all persons, sorted by the specified field, without materializing the full list.
+
+        Args:
+            sort_by (str): Field to sort by (default: "name").
+
+        Returns:
+            Iterator[Person]: Generator of Person objects, read from the database in batches. It holds a pooled
+                read connection until it is exhausted or closed, so close it when stopping early.
+
+        Raises:
+            ValueError: If the sort field is invalid.
+            sqlite3.Error: If a database error occurs while iterating.
+        """
+        if sort_by not in self._PERSON_SORT:
+            raise ValueError(f"Invalid sort field: {sort_by}. Must be one of {set(self._PERSON_SORT)}")
+        return self._iter_entities(PERSON_FACTORY, self._PERSON_LIST_SQL[sort_by], "Person")
+
     # Task CRUD Operations
     def get_all_tasks(self, sort_by: str = "title") -> List[Task]:
         """
@@ -335,20 +913,88 @@ class ProjectManagementRepository:
             ValueError: If the sort field is invalid.
             sqlite3.Error: If a database error occurs.
         """
-        valid_sort_fields = {"title", "priority", "person_id", "status"}
-        if sort_by not in valid_sort_fields:
-            raise ValueError(f"Invalid sort field: {sort_by}. Must be one of {valid_sort_fields}")
+        if sort_by not in self._TASK_SORT:
+            raise ValueError(f"Invalid sort field: {sort_by}. Must be one of {set(self._TASK_SORT)}")
         try:
-            with self._get_connection() as conn:
+            with self._get_read_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(f'SELECT * FROM Task ORDER BY {sort_by}')
-                tasks = [load_entity(TaskFactory(), row) for row in cursor.fetchall()]
-                logger.info(f"Retrieved {len(tasks)} tasks, sorted by {sort_by}")
+                cursor.row_factory = TASK_FACTORY.row_factory
+                cursor.execute(self._TASK_LIST_SQL[sort_by])
+                tasks = cursor.fetchall()
+                logger.info("Retrieved %s tasks, sorted by %s", len(tasks), sort_by)
                 return tasks
         except sqlite3.Error as e:
-            logger.error(f"Task list retrieval error: {e}")
+            logger.error("Task list retrieval error: %s", e)
             raise sqlite3.Error(f"Task list retrieval error: {e}")
 
+    def iter_all_tasks(self, sort_by: str = "title") -> Iterator[Task]:
+        """
+        Stream all tasks, sorted by the specified field, without materializing the full list.
+
+        Args:
+            sort_by (str): Field to sort by (default: "title").
+
+        Returns:
+            Iterator[Task]: Generator of Task objects, read from the database in batches. It holds a pooled
+                read connection until it is exhausted or closed, so close it when stopping early.
+
+        Raises:
+            ValueError: If the sort field is invalid.
+            sqlite3.Error: If a database error occurs while iterating.
+        """
+        if sort_by not in self._TASK_SORT:
+            raise ValueError(f"Invalid sort field: {sort_by}. Must be one of {set(self._TASK_SORT)}")
+        return self._iter_entities(TASK_FACTORY, self._TASK_LIST_SQL[sort_by], "Task")
+
+    def get_all_tasks_with_names(self, sort_by: str = "title") -> List[tuple]:
+        """
+        Retrieve all tasks together with their assigned person's and milestone's names in a single query.
+
+        Args:
+            sort_by (str): Field to sort by (default: "title").
+
+        Returns:
+            List[tuple]: (Task, person name, milestone name) tuples; a name is None when the task has no
+                person or milestone.
+
+        Raises:
+            ValueError: If the sort field is invalid.
+            sqlite3.Error: If a database error occurs.
+        """
+        if sort_by not in self._TASK_SORT:
+            raise ValueError(f"Invalid sort field: {sort_by}. Must be one of {set(self._TASK_SORT)}")
+        try:
+            with self._get_read_connection() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = TASK_FACTORY.named_row_factory
+                cursor.execute(self._TASK_NAMED_SQL[sort_by])
+                rows = cursor.fetchall()
+                logger.info("Retrieved %s tasks with names, sorted by %s", len(rows), sort_by)
+                return rows
+        except sqlite3.Error as e:
+            logger.error("Task list retrieval error: %s", e)
+            raise sqlite3.Error(f"Task list retrieval error: {e}")
+
+    def iter_tasks_export(self, sort_by: str = "title") -> Iterator[tuple]:
+        """
+        Stream all tasks as flat CSV-ready rows, with names resolved in the same query.
+
+        Args:
+            sort_by (str): Field to sort by (default: "title").
+
+        Returns:
+            Iterator[tuple]: (id, title, description, status, priority, start date, due date, person name,
+                milestone name) rows, read from the database in batches; the milestone name is 'None' for
+                tasks without a milestone.
+
+        Raises:
+            ValueError: If the sort field is invalid.
+            sqlite3.Error: If a database error occurs while iterating.
+        """
+        if sort_by not in self._TASK_SORT:
+            raise ValueError(f"Invalid sort field: {sort_by}. Must be one of {set(self._TASK_SORT)}")
+        return self._iter_rows(self._TASK_EXPORT_SQL[sort_by], "Task")
+
     def add_task(self, title: str, description: str, status: str, priority: str, start_date: str, due_date: str,
                  person_id: int, milestone_id: Optional[int] = None) -> Task:
         """
@@ -380,26 +1026,57 @@ class ProjectManagementRepository:
         if milestone_id:
             self._validate_foreign_key("Milestone", "id", milestone_id)
         try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    'INSERT INTO Task (title, description, status, priority, start_date, due_date, person_id, milestone_id) '
-                    'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
-                    (title, description, status, priority, start_date, due_date, person_id, milestone_id))
-                conn.commit()
-                task = load_entity(TaskFactory(), (cursor.lastrowid, title, description, status, priority, start_date,
-                                                   due_date, person_id, milestone_id))
-                # task = EntityFactory.create_task((cursor.lastrowid, title, description, status, priority, start_date,
-                #                                   due_date, person_id, milestone_id))
-                logger.info(f"Added task: {task}")
-                return task
+            task = self._insert_entity(
+                TASK_FACTORY, (title, description, status, priority, start_date, due_date, person_id, milestone_id))
+            logger.info("Added task: %s", task)
+            return task
+        except sqlite3.Error as e:
+            logger.error("Task insertion error: %s", e)
+            raise sqlite3.Error(f"Task insertion error: {e}")
+
+    def add_tasks(self, rows: List[tuple]) -> List[Task]:
+        """
+        Add many tasks in a single transaction.
+
+        Args:
+            rows (List[tuple]): (title, description, status, priority, start_date, due_date, person_id,
+                milestone_id) tuples, in the argument order of add_task; milestone_id may be None.
+
+        Returns:
+            List[Task]: The created Task objects, in input order.
+
+        Raises:
+            ValueError: If any status, priority, or date is invalid; nothing is inserted.
+            LookupError: If any person_id or milestone_id (if provided) is invalid; nothing is inserted.
+            sqlite3.Error: If the insertion fails; nothing is inserted.
+        """
+        rows = [tuple(row) for row in rows]
+        if not rows:
+            return []
+        # Same checks as add_task: the CHECK constraints let NULL through and are missing from older databases
+        for _, _, status, priority, start_date, due_date, _, _ in rows:
+            self._validate_status(status)
+            self._validate_priority(priority)
+            self._validate_date(start_date)
+            self._validate_date(due_date)
+        try:
+            with self.atomic():
+                # Check each referenced row once, inside the transaction so it cannot vanish before the insert
+                for person_id in {row[6] for row in rows}:
+                    self._validate_foreign_key("Person", "id", person_id)
+                for milestone_id in {row[7] for row in rows if row[7]}:
+                    self._validate_foreign_key("Milestone", "id", milestone_id)
+                ids = self._insert_rows(TASK_FACTORY.INSERT, rows)
         except sqlite3.Error as e:
-            logger.error(f"Task insertion error: {e}")
+            logger.error("Task insertion error: %s", e)
             raise sqlite3.Error(f"Task insertion error: {e}")
+        tasks = TASK_FACTORY.create_batch([(task_id, *row) for task_id, row in zip(ids, rows)])
+        logger.info("Added %s tasks", len(tasks))
+        return tasks
 
     def get_task(self, task_id: int) -> Optional[Task]:
         """
-        Retrieve a task by its ID.
+        Retrieve a task by its ID, served from an in-memory cache after the first lookup.
 
         Args:
             task_id (int): ID of the task to retrieve.
@@ -411,20 +1088,41 @@ class ProjectManagementRepository:
             LookupError: If no task is found with the given ID.
             sqlite3.Error: If a database error occurs.
         """
+        return self._cached(self._task_cache, task_id, self._fetch_task)
+
+    def get_tasks(self, task_ids: List[int]) -> List[Task]:
+        """
+        Retrieve many tasks by ID with a single query instead of one get_task call each.
+
+        Args:
+            task_ids (List[int]): IDs of the tasks to retrieve.
+
+        Returns:
+            List[Task]: The Task objects, in the order of task_ids.
+
+        Raises:
+            LookupError: If any of the IDs does not exist.
+            sqlite3.Error: If a database error occurs.
+        """
+        return self._get_many(TASK_FACTORY, task_ids, "Task")
+
+    def _fetch_task(self, task_id: int) -> Task:
+        """
+        Load a task by ID from the database, bypassing the cache.
+        """
         try:
-            with self._get_connection() as conn:
+            with self._get_read_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute('SELECT * FROM Task WHERE id = ?', (task_id,))
-                row = cursor.fetchone()
-                if not row:
-                    logger.warning(f"Task with id {task_id} not found")
+                cursor.row_factory = TASK_FACTORY.row_factory
+                cursor.execute(TASK_FACTORY.SELECT_BY_ID, (task_id,))
+                task = cursor.fetchone()
+                if not task:
+                    logger.warning("Task with id %s not found", task_id)
                     raise LookupError(f"Task with id {task_id} not found")
-                # task = EntityFactory.create_task(row)
-                task = load_entity(TaskFactory(), row)
-                logger.info(f"Retrieved task: {task}")
+                logger.info("Retrieved task: %s", task)
                 return task
         except sqlite3.Error as e:
-            logger.error(f"Task retrieval error: {e}")
+            logger.error("Task retrieval error: %s", e)
             raise sqlite3.Error(f"Task retrieval error: {e}")
 
     def update_task(self, task_id: int, title: Optional[str] = None, description: Optional[str] = None,
@@ -453,39 +1151,34 @@ class ProjectManagementRepository:
             LookupError: If task_id, person_id, or milestone_id (if provided) is invalid.
             sqlite3.Error: If the update fails.
         """
-        task = self.get_task(task_id)
-        title = title or task.title
-        description = description or task.description
-        status = status or task.status
-        priority = priority or task.priority
-        start_date = start_date or task.start_date
-        due_date = due_date or task.due_date
-        person_id = person_id or task.person_id
-        milestone_id = milestone_id if milestone_id is not None else task.milestone_id
-        self._validate_status(status)
-        self._validate_priority(priority)
-        self._validate_date(start_date)
-        self._validate_date(due_date)
-        self._validate_foreign_key("Person", "id", person_id)
+        # Only the supplied values are validated; the stored ones were checked when they were written
+        if status:
+            self._validate_status(status)
+        if priority:
+            self._validate_priority(priority)
+        if start_date:
+            self._validate_date(start_date)
+        if due_date:
+            self._validate_date(due_date)
+        if person_id:
+            self._validate_foreign_key("Person", "id", person_id)
         if milestone_id:
             self._validate_foreign_key("Milestone", "id", milestone_id)
         try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    'UPDATE Task SET title = ?, description = ?, status = ?, priority = ?, start_date = ?, '
-                    'due_date = ?, person_id = ?, milestone_id = ? WHERE id = ?',
-                    (title, description, status, priority, start_date, due_date, person_id, milestone_id,
-                     task_id))
-                conn.commit()
-                updated_task = Task(id=task_id, title=title, description=description, status=status,
-                                    priority=priority, start_date=start_date, due_date=due_date,
-                                    person_id=person_id, milestone_id=milestone_id)
-                logger.info(f"Updated task: {updated_task}")
-                return updated_task
+            # Empty values keep the stored ones, as COALESCE only skips NULL; milestone_id is kept only for None
+            updated_task = self._update_entity(
+                TASK_FACTORY, (title or None, description or None, status or None, priority or None,
+                               start_date or None, due_date or None, person_id or None, milestone_id), task_id)
         except sqlite3.Error as e:
-            logger.error(f"Task update error: {e}")
+            logger.error("Task update error: %s", e)
             raise sqlite3.Error(f"Task update error: {e}")
+        if updated_task is None:
+            logger.warning("Task with id %s not found", task_id)
+            raise LookupError(f"Task with id {task_id} not found")
+        with self._lock:
+            self._task_cache.pop(task_id, None)
+        logger.info("Updated task: %s", updated_task)
+        return updated_task
 
     def delete_task(self, task_id: int):
         """
@@ -498,17 +1191,37 @@ class ProjectManagementRepository:
             LookupError: If no task is found with the given ID.
             sqlite3.Error: If the deletion fails.
         """
-        self._validate_foreign_key("Task", "id", task_id)
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute('DELETE FROM Task WHERE id = ?', (task_id,))
-                conn.commit()
-                logger.info(f"Deleted task with id {task_id}")
+                cursor.execute(TASK_FACTORY.DELETE, (task_id,))
+                self._task_cache.pop(task_id, None)
+                self._forget_foreign_key("Task", task_id)
+                if cursor.rowcount == 0:  # Caches are pruned first: another writer may have removed the row
+                    raise LookupError(f"No Task found with id = {task_id}")
+                logger.info("Deleted task with id %s", task_id)
         except sqlite3.Error as e:
-            logger.error(f"Task deletion error: {e}")
+            logger.error("Task deletion error: %s", e)
             raise sqlite3.Error(f"Task deletion error: {e}")
 
+    def delete_tasks(self, task_ids: List[int]):
+        """
+        Delete many tasks in a single transaction.
+
+        Args:
+            task_ids (List[int]): IDs of the tasks to delete.
+
+        Raises:
+            LookupError: If any of the IDs does not exist; nothing is deleted.
+            sqlite3.Error: If the deletion fails; nothing is deleted.
+        """
+        deleted_ids = self._delete_rows(TASK_FACTORY, task_ids, "Task")
+        with self._lock:
+            for task_id in deleted_ids:
+                self._task_cache.pop(task_id, None)
+                self._forget_foreign_key("Task", task_id)
+        logger.info("Deleted %s tasks", len(deleted_ids))
+
     def get_tasks_by_milestone(self, milestone_id: int, status: Optional[str] = None, priority: Optional[str] = None,
                                sort_by: str = "due_date") -> List[Task]:
         """
@@ -528,33 +1241,26 @@ class ProjectManagementRepository:
             LookupError: If milestone_id is invalid.
             sqlite3.Error: If a database error occurs.
         """
-        valid_sort_fields = {"id", "title", "status", "priority", "start_date", "due_date"}
-        if sort_by not in valid_sort_fields:
-            raise ValueError(f"Invalid sort field: {sort_by}. Must be one of {valid_sort_fields}")
+        if sort_by not in self._MILESTONE_TASK_SORT:
+            raise ValueError(f"Invalid sort field: {sort_by}. Must be one of {set(self._MILESTONE_TASK_SORT)}")
         if status and status not in self.VALID_STATUSES:
             raise ValueError(f"Invalid status filter: {status}")
         if priority and priority not in self.VALID_PRIORITIES:
             raise ValueError(f"Invalid priority filter: {priority}")
         self._validate_foreign_key("Milestone", "id", milestone_id)
-        query = 'SELECT * FROM Task WHERE milestone_id = ?'
-        params = [milestone_id]
-        if status:
-            query += ' AND status = ?'
-            params.append(status)
-        if priority:
-            query += ' AND priority = ?'
-            params.append(priority)
-        query += f' ORDER BY {sort_by}'
+        query = self._MILESTONE_TASK_SQL[(bool(status), bool(priority), sort_by)]
+        params = (milestone_id, *(value for value in (status, priority) if value))
         try:
-            with self._get_connection() as conn:
+            with self._get_read_connection() as conn:
                 cursor = conn.cursor()
+                cursor.row_factory = TASK_FACTORY.row_factory
                 cursor.execute(query, params)
-                tasks = [load_entity(TaskFactory(), row) for row in cursor.fetchall()]
-                logger.info(
-                    f"Retrieved {len(tasks)} tasks for milestone {milestone_id}, status={status}, priority={priority}, sorted by {sort_by}")
+                tasks = cursor.fetchall()
+                logger.info("Retrieved %s tasks for milestone %s, status=%s, priority=%s, sorted by %s",
+                            len(tasks), milestone_id, status, priority, sort_by)
                 return tasks
         except sqlite3.Error as e:
-            logger.error(f"Task list retrieval error: {e}")
+            logger.error("Task list retrieval error: %s", e)
             raise sqlite3.Error(f"Task list retrieval error: {e}")
 
     # Milestone CRUD Operations
@@ -572,21 +1278,42 @@ class ProjectManagementRepository:
             sqlite3.Error: If the insertion fails.
         """
         try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('INSERT INTO Milestone (name) VALUES (?)', (name,))
-                conn.commit()
-                # milestone = EntityFactory.create_milestone((cursor.lastrowid, name))
-                milestone = load_entity(MilestoneFactory(), (cursor.lastrowid, name))
-                logger.info(f"Added milestone: {milestone}")
-                return milestone
+            milestone = self._insert_entity(MILESTONE_FACTORY, (name,))
+            logger.info("Added milestone: %s", milestone)
+            return milestone
+        except sqlite3.Error as e:
+            logger.error("Milestone insertion error: %s", e)
+            raise sqlite3.Error(f"Milestone insertion error: {e}")
+
+    def add_milestones(self, names: List[str]) -> List[Milestone]:
+        """
+        Add many milestones in a single transaction.
+
+        Args:
+            names (List[str]): Names of the milestones.
+
+        Returns:
+            List[Milestone]: The created Milestone objects, in input order.
+
+        Raises:
+            sqlite3.Error: If the insertion fails; nothing is inserted.
+        """
+        rows = [(name,) for name in names]
+        if not rows:
+            return []
+        try:
+            with self.atomic():
+                ids = self._insert_rows(MILESTONE_FACTORY.INSERT, rows)
         except sqlite3.Error as e:
-            logger.error(f"Milestone insertion error: {e}")
+            logger.error("Milestone insertion error: %s", e)
             raise sqlite3.Error(f"Milestone insertion error: {e}")
+        milestones = MILESTONE_FACTORY.create_batch([(milestone_id, *row) for milestone_id, row in zip(ids, rows)])
+        logger.info("Added %s milestones", len(milestones))
+        return milestones
 
     def get_milestone(self, milestone_id: int) -> Optional[Milestone]:
         """
-        Retrieve a milestone by its ID.
+        Retrieve a milestone by its ID, served from an in-memory cache after the first lookup.
 
         Args:
             milestone_id (int): ID of the milestone to retrieve.
@@ -598,20 +1325,41 @@ class ProjectManagementRepository:
             LookupError: If no milestone is found with the given ID.
             sqlite3.Error: If a database error occurs.
         """
+        return self._cached(self._milestone_cache, milestone_id, self._fetch_milestone)
+
+    def get_milestones(self, milestone_ids: List[int]) -> List[Milestone]:
+        """
+        Retrieve many milestones by ID with a single query instead of one get_milestone call each.
+
+        Args:
+            milestone_ids (List[int]): IDs of the milestones to retrieve.
+
+        Returns:
+            List[Milestone]: The Milestone objects, in the order of milestone_ids.
+
+        Raises:
+            LookupError: If any of the IDs does not exist.
+            sqlite3.Error: If a database error occurs.
+        """
+        return self._get_many(MILESTONE_FACTORY, milestone_ids, "Milestone")
+
+    def _fetch_milestone(self, milestone_id: int) -> Milestone:
+        """
+        Load a milestone by ID from the database, bypassing the cache.
+        """
         try:
-            with self._get_connection() as conn:
+            with self._get_read_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute('SELECT * FROM Milestone WHERE id = ?', (milestone_id,))
-                row = cursor.fetchone()
-                if not row:
-                    logger.warning(f"Milestone with id {milestone_id} not found")
+                cursor.row_factory = MILESTONE_FACTORY.row_factory
+                cursor.execute(MILESTONE_FACTORY.SELECT_BY_ID, (milestone_id,))
+                milestone = cursor.fetchone()
+                if not milestone:
+                    logger.warning("Milestone with id %s not found", milestone_id)
                     raise LookupError(f"Milestone with id {milestone_id} not found")
-                # milestone = EntityFactory.create_milestone(row)
-                milestone = load_entity(MilestoneFactory(), row)
-                logger.info(f"Retrieved milestone: {milestone}")
+                logger.info("Retrieved milestone: %s", milestone)
                 return milestone
         except sqlite3.Error as e:
-            logger.error(f"Milestone retrieval error: {e}")
+            logger.error("Milestone retrieval error: %s", e)
             raise sqlite3.Error(f"Milestone retrieval error: {e}")
 
     def update_milestone(self, milestone_id: int, name: Optional[str] = None) -> Milestone:
@@ -629,20 +1377,18 @@ class ProjectManagementRepository:
             LookupError: If no milestone is found with the given ID.
             sqlite3.Error: If the update fails.
         """
-        milestone = self.get_milestone(milestone_id)
-        name = name or milestone.name
         try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('UPDATE Milestone SET name = ? WHERE id = ?',
-                               (name, milestone_id))
-                conn.commit()
-                updated_milestone = Milestone(id=milestone_id, name=name)
-                logger.info(f"Updated milestone: {updated_milestone}")
-                return updated_milestone
+            updated_milestone = self._update_entity(MILESTONE_FACTORY, (name or None,), milestone_id)
         except sqlite3.Error as e:
-            logger.error(f"Milestone update error: {e}")
+            logger.error("Milestone update error: %s", e)
             raise sqlite3.Error(f"Milestone update error: {e}")
+        if updated_milestone is None:
+            logger.warning("Milestone with id %s not found", milestone_id)
+            raise LookupError(f"Milestone with id {milestone_id} not found")
+        with self._lock:
+            self._milestone_cache.pop(milestone_id, None)
+        logger.info("Updated milestone: %s", updated_milestone)
+        return updated_milestone
 
     def delete_milestone(self, milestone_id: int):
         """
@@ -655,17 +1401,39 @@ class ProjectManagementRepository:
             LookupError: If no milestone is found with the given ID.
             sqlite3.Error: If the deletion fails.
         """
-        self._validate_foreign_key("Milestone", "id", milestone_id)
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute('DELETE FROM Milestone WHERE id = ?', (milestone_id,))
-                conn.commit()
-                logger.info(f"Deleted milestone with id {milestone_id}")
+                cursor.execute(MILESTONE_FACTORY.DELETE, (milestone_id,))
+                self._milestone_cache.pop(milestone_id, None)
+                self._forget_tasks("milestone_id", milestone_id)  # Linked tasks have milestone_id set to NULL
+                self._forget_foreign_key("Milestone", milestone_id)
+                if cursor.rowcount == 0:  # Caches are pruned first: another writer may have removed the row
+                    raise LookupError(f"No Milestone found with id = {milestone_id}")
+                logger.info("Deleted milestone with id %s", milestone_id)
         except sqlite3.Error as e:
-            logger.error(f"Milestone deletion error: {e}")
+            logger.error("Milestone deletion error: %s", e)
             raise sqlite3.Error(f"Milestone deletion error: {e}")
 
+    def delete_milestones(self, milestone_ids: List[int]):
+        """
+        Delete many milestones in a single transaction.
+
+        Args:
+            milestone_ids (List[int]): IDs of the milestones to delete.
+
+        Raises:
+            LookupError: If any of the IDs does not exist; nothing is deleted.
+            sqlite3.Error: If the deletion fails; nothing is deleted.
+        """
+        deleted_ids = self._delete_rows(MILESTONE_FACTORY, milestone_ids, "Milestone")
+        with self._lock:
+            for milestone_id in deleted_ids:
+                self._milestone_cache.pop(milestone_id, None)
+                self._forget_tasks("milestone_id", milestone_id)  # Linked tasks have milestone_id set to NULL
+                self._forget_foreign_key("Milestone", milestone_id)
+        logger.info("Deleted %s milestones", len(deleted_ids))
+
     def get_all_milestones(self, sort_by: str = "name") -> List[Milestone]:
         """
         Retrieve all milestones, sorted by the specified field.
@@ -680,16 +1448,35 @@ class ProjectManagementRepository:
             ValueError: If the sort field is invalid.
             sqlite3.Error: If a database error occurs.
         """
-        valid_sort_fields = {"name"}
-        if sort_by not in valid_sort_fields:
-            raise ValueError(f"Invalid sort field: {sort_by}. Must be one of {valid_sort_fields}")
+        if sort_by not in self._MILESTONE_SORT:
+            raise ValueError(f"Invalid sort field: {sort_by}. Must be one of {set(self._MILESTONE_SORT)}")
         try:
-            with self._get_connection() as conn:
+            with self._get_read_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(f'SELECT * FROM Milestone ORDER BY {sort_by}')
-                milestones = [load_entity(MilestoneFactory(), row) for row in cursor.fetchall()]
-                logger.info(f"Retrieved {len(milestones)} milestones, sorted by {sort_by}")
+                cursor.row_factory = MILESTONE_FACTORY.row_factory
+                cursor.execute(self._MILESTONE_LIST_SQL[sort_by])
+                milestones = cursor.fetchall()
+                logger.info("Retrieved %s milestones, sorted by %s", len(milestones), sort_by)
                 return milestones
         except sqlite3.Error as e:
-            logger.error(f"Milestone list retrieval error: {e}")
+            logger.error("Milestone list retrieval error: %s", e)
             raise sqlite3.Error(f"Milestone list retrieval error: {e}")
+
+    def iter_all_milestones(self, sort_by: str = "name") -> Iterator[Milestone]:
+        """
+        Stream all milestones, sorted by the specified field, without materializing the full list.
+
+        Args:
+            sort_by (str): Field to sort by (default: "name").
+
+        Returns:
+            Iterator[Milestone]: Generator of Milestone objects, read from the database in batches. It holds a pooled
+                read connection until it is exhausted or closed, so close it when stopping early.
+
+        Raises:
+            ValueError: If the sort field is invalid.
+            sqlite3.Error: If a database error occurs while iterating.
+        """
+        if sort_by not in self._MILESTONE_SORT:
+            raise ValueError(f"Invalid sort field: {sort_by}. Must be one of {set(self._MILESTONE_SORT)}")
+        return self._iter_entities(MILESTONE_FACTORY, self._MILESTONE_LIST_SQL[sort_by], "Milestone")
@@ -1,19 +1,22 @@
 import csv
-import logging
+import re
 import sqlite3
 import sys
-from datetime import datetime
 
+import matplotlib.dates as mdates
+import numpy as np
 import matplotlib.pyplot as plt
-from PyQt6.QtCore import QDate, Qt
-from PyQt6.QtGui import QTextCharFormat, QColor
+from PyQt6.QtCore import QDate, Qt, QThreadPool, QTimer, QSortFilterProxyModel
+from PyQt6.QtGui import QTextCharFormat, QColor, QStandardItem
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QDialog, QFormLayout, QComboBox, QDialogButtonBox, QMessageBox,
-                             QLineEdit, QTableWidget, QTableWidgetItem, QDateEdit, QFileDialog)
+                             QLineEdit, QTableView, QDateEdit, QFileDialog)
 from PyQt6.uic import loadUi
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 
-from config import DB_PATH
+from config import DB_PATH, get_logger
 from design_pattern.repository.repository import ProjectManagementRepository
+from gui.models import TaskTableModel, MilestoneTableModel, PersonTableModel
+from gui.workers import FetchJob
 
 
 class ProjectManagementGUI(QMainWindow):
@@ -22,6 +25,11 @@ class ProjectManagementGUI(QMainWindow):
     Provides a user interface with tables, dialogs, and a Gantt chart for CRUD operations and data visualization.
     """
 
+    FILTER_DEBOUNCE_MS = 150  # Quiet time after the last keystroke before a filter is applied
+    REFRESH_COALESCE_MS = 30  # Window in which repeated chart and calendar refresh requests are merged into one
+    DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')  # Shape check before handing date strings to NumPy
+    ROLE_PLACEHOLDER = "e.g., Developer, Manager"  # Hint shown in the empty role field of the person dialogs
+
     def __init__(self):
         """
         Initialize the main window, set up the repository, and configure the UI.
@@ -32,7 +40,8 @@ class ProjectManagementGUI(QMainWindow):
         self.setWindowTitle("Project Management System")  # Set the window title
         self.setGeometry(100, 100, 1000, 600)  # Set window position and size
         self.repository = ProjectManagementRepository(DB_PATH)  # Initialize repository with database path
-        self.logger = logging.getLogger(__name__)  # Configure logger
+        self.logger = get_logger(__name__)  # Configure logger
+        self.refresh_generations = {}  # Latest background fetch per view; older results are dropped
         self.init_ui()  # Set up UI components
         self.load_initial_window()  # Load initial window content
 
@@ -45,117 +54,492 @@ class ProjectManagementGUI(QMainWindow):
         """
         loadUi("gui/main_window.ui", self)  # Load UI from file
         # Connect main bar
-        self.searchBox.textChanged.connect(self.search_active_tab)  # Connect search box to filter active tab
+        self.debounce(self.searchBox, self.search_active_tab)  # Connect search box to filter active tab
         # Connect tasks tab actions
         self.tasksAddButton.clicked.connect(self.open_create_task_dialog)  # Add task button
         self.tasksUpdateButton.clicked.connect(self.open_update_task_dialog)  # Update task button
         self.tasksDeleteButton.clicked.connect(self.delete_task)  # Delete task button
         self.tasksExportButton.clicked.connect(self.export_tasks_to_csv)  # Export tasks button
-        self.tasksFilterBox.textChanged.connect(self.filter_tasks)  # Task filter input
+        self.debounce(self.tasksFilterBox, self.filter_tasks)  # Task filter input
         # Connect milestones tab actions
         self.milestonesAddButton.clicked.connect(self.open_create_milestone_dialog)  # Add milestone button
         self.milestonesUpdateButton.clicked.connect(self.open_update_milestone_dialog)  # Update milestone button
         self.milestonesDeleteButton.clicked.connect(self.delete_milestone)  # Delete milestone button
-        self.milestonesFilterBox.textChanged.connect(self.filter_milestones)  # Milestone filter input
+        self.debounce(self.milestonesFilterBox, self.filter_milestones)  # Milestone filter input
         # Connect people tab actions
         self.peopleAddButton.clicked.connect(self.open_create_person_dialog)  # Add person button
         self.peopleUpdateButton.clicked.connect(self.open_update_person_dialog)  # Update person button
         self.peopleDeleteButton.clicked.connect(self.delete_person)  # Delete person button
-        self.peopleFilterBox.textChanged.connect(self.filter_people)  # Person filter input
+        self.debounce(self.peopleFilterBox, self.filter_people)  # Person filter input
         self.milestonesCalendar.clicked.connect(self.show_milestone_details)
+        # Refresh requests for the heavy views are coalesced, so a burst of mutations redraws them once
+        self.schedule_gantt_refresh = self.coalesce(self.refresh_gantt_chart)
+        self.schedule_calendar_refresh = self.coalesce(lambda: self.refresh_milestones_calendar(self.milestone_filter))
+        # Only the shown page carries highlights, so paging the calendar applies those of the new page
+        self.milestonesCalendar.currentPageChanged.connect(lambda year, month: self.schedule_calendar_refresh())
         # Initialize tables
         self.setup_tables()  # Configure table widgets
         # Initialize Gantt chart
         self.setup_gantt_chart()  # Set up Gantt chart visualization
 
+    def closeEvent(self, event):
+        """
+        Wait for background fetches to finish before the window goes away.
+
+        Args:
+            event (QCloseEvent): The close event.
+        """
+        QThreadPool.globalInstance().waitForDone()
+        super().closeEvent(event)
+
+    def run_in_background(self, key, fetch, on_done, error_prefix):
+        """
+        Run a database fetch on the global thread pool and pass its result to a slot on the GUI thread.
+
+        Only the most recent fetch per key is delivered, so a slow earlier refresh cannot overwrite newer data.
+
+        Args:
+            key (str): View the fetch belongs to.
+            fetch (callable): Zero-argument callable run on a worker thread; must not touch widgets.
+            on_done (callable): Receives the fetch result on the GUI thread.
+            error_prefix (str): Prefix of the error dialog shown if the fetch fails.
+        """
+        generation = self.refresh_generations.get(key, 0) + 1
+        self.refresh_generations[key] = generation
+
+        def deliver(result):
+            if self.refresh_generations[key] == generation:
+                on_done(result)
+
+        def fail(message):
+            if self.refresh_generations[key] == generation:
+                self.logger.error("%s: %s", error_prefix, message)
+                self.show_error(f"{error_prefix}: {message}")
+
+        job = FetchJob(fetch)
+        job.signals.done.connect(deliver)
+        job.signals.failed.connect(fail)
+        QThreadPool.globalInstance().start(job)
+
+    def debounce(self, line_edit, slot):
+        """
+        Call slot with the line edit's text once typing has paused for FILTER_DEBOUNCE_MS.
+
+        Args:
+            line_edit (QLineEdit): Input whose textChanged signal is coalesced.
+            slot (callable): Receives the current text.
+        """
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(self.FILTER_DEBOUNCE_MS)
+        timer.timeout.connect(lambda: slot(line_edit.text()))
+        line_edit.textChanged.connect(lambda _text: timer.start())  # Each keystroke restarts the countdown
+
+    def coalesce(self, slot):
+        """
+        Wrap a refresh slot so calls made within REFRESH_COALESCE_MS of the first one run it only once.
+
+        Args:
+            slot (callable): Zero-argument refresh method.
+
+        Returns:
+            callable: Schedules the slot unless a run is already pending.
+        """
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(self.REFRESH_COALESCE_MS)
+        timer.timeout.connect(slot)
+
+        def schedule():
+            if not timer.isActive():  # Unlike debounce, later calls must not push the pending run back
+                timer.start()
+
+        return schedule
+
+    def filter_proxy(self, model, column):
+        """
+        Wrap a table model in a case-insensitive substring filter on one column.
+
+        Args:
+            model (RowTableModel): Source model.
+            column (int): Column the filter text is matched against.
+
+        Returns:
+            QSortFilterProxyModel: The proxy to attach to the view.
+        """
+        proxy = QSortFilterProxyModel(self)
+        proxy.setSourceModel(model)
+        proxy.setFilterKeyColumn(column)
+        proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        return proxy
+
     def setup_tables(self):
         """
         Configure the structure and properties of the Tasks, Milestones, and People tables.
 
-        Sets column counts, headers, and selection behavior for each table.
+        Attaches a table model to each view and sets selection behavior.
         """
         # Tasks table
-        self.tasksTable.setColumnCount(7)  # Set 7 columns for task data
-        self.tasksTable.setHorizontalHeaderLabels(
-            ["ID", "Title", "Status", "Priority", "Start Date", "Due Date", "Assigned Person"])  # Set column headers
-        self.tasksTable.setColumnHidden(0, True)  # Hide ID column
-        self.tasksTable.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)  # Select entire rows
-        self.tasksTable.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)  # Allow single row selection
+        self.taskModel = TaskTableModel(self)  # Row data for the tasks view; headers come from the model
+        self.tasksTable.setModel(self.filter_proxy(self.taskModel, 0))  # Filtered by title without re-querying
+        self.tasksTable.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)  # Select entire rows
+        self.tasksTable.setSelectionMode(QTableView.SelectionMode.ExtendedSelection)  # Allow multi-row selection
         self.tasksTable.horizontalHeader().setStretchLastSection(True)  # Stretch last column to fill space
         # Milestones table
-        self.milestonesTable.setColumnCount(2)  # Set 2 columns for milestone data
-        self.milestonesTable.setHorizontalHeaderLabels(["ID", "Name"])  # Set column headers
-        self.milestonesTable.setColumnHidden(0, True)  # Hide ID column
-        self.milestonesTable.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)  # Select entire rows
-        self.milestonesTable.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)  # Allow single row selection
+        self.milestoneModel = MilestoneTableModel(self)
+        self.milestonesTable.setModel(self.filter_proxy(self.milestoneModel, 0))  # Filtered by name
+        self.milestone_filter = ""  # Current milestone filter text, also applied to the calendar
+        self.task_rows = None  # Latest (Task, person name, milestone name) rows, shared by the chart and calendar
+        self.calendar_tooltips = {}  # Julian day -> tooltip of the highlight currently applied to the calendar
+        self.milestone_days = None  # Julian day -> [(milestone name, task title)] built from task_rows on first use
+        self.milestonesTable.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)  # Select entire rows
+        self.milestonesTable.setSelectionMode(QTableView.SelectionMode.ExtendedSelection)  # Allow multi-row selection
         self.milestonesTable.horizontalHeader().setStretchLastSection(True)  # Stretch last column to fill space
         # People table
-        self.peopleTable.setColumnCount(4)  # Set 4 columns for person data
-        self.peopleTable.setHorizontalHeaderLabels(["ID", "Name", "Email", "Role"])  # Set column headers
-        self.peopleTable.setColumnHidden(0, True)  # Hide ID column
-        self.peopleTable.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)  # Select entire rows
-        self.peopleTable.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)  # Allow single row selection
+        self.personModel = PersonTableModel(self)
+        self.peopleTable.setModel(self.filter_proxy(self.personModel, 0))  # Filtered by name
+        self.peopleTable.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)  # Select entire rows
+        self.peopleTable.setSelectionMode(QTableView.SelectionMode.ExtendedSelection)  # Allow multi-row selection
         self.peopleTable.horizontalHeader().setStretchLastSection(True)  # Stretch last column to fill space
+        # Combo-box entries for the task dialogs, rebuilt whenever the people or milestones tables reload
+        self.person_options = None  # (label, person ID) pairs
+        self.milestone_options = None  # (label, milestone ID) pairs
+
+    def get_person_options(self):
+        """
+        Return the cached assigned-person combo-box entries, loading them on first use.
+
+        Returns:
+            list: (label, person ID) pairs.
+
+        Raises:
+            sqlite3.Error: If a database error occurs.
+        """
+        if self.person_options is None:
+            self.person_options = [(f"{person.id}: {person.name}", person.id)
+                                   for person in self.repository.get_all_persons()]
+        return self.person_options
+
+    def get_milestone_options(self):
+        """
+        Return the cached milestone combo-box entries, loading them on first use.
+
+        Returns:
+            list: (label, milestone ID) pairs.
+
+        Raises:
+            sqlite3.Error: If a database error occurs.
+        """
+        if self.milestone_options is None:
+            self.milestone_options = [(f"{milestone.id}: {milestone.name}", milestone.id)
+                                      for milestone in self.repository.get_all_milestones()]
+        return self.milestone_options
+
+    @staticmethod
+    def fill_combo(combo, options):
+        """
+        Append entries to a combo box in one batch; each entry's ID is available through currentData().
+
+        Args:
+            combo (QComboBox): Combo box backed by its default QStandardItemModel.
+            options (list): (label, ID) pairs.
+        """
+        items = []
+        for label, item_id in options:
+            item = QStandardItem(label)
+            item.setData(item_id, Qt.ItemDataRole.UserRole)
+            items.append(item)
+        combo.model().invisibleRootItem().appendRows(items)
+
+    def selected_id(self, table):
+        """
+        Return the ID of the row selected in a table view.
+
+        Args:
+            table (QTableView): One of the tasks, milestones, or people views.
+
+        Returns:
+            int or None: The selected entity's ID, or None if nothing is selected.
+        """
+        selected = table.selectionModel().selectedRows()
+        if not selected:
+            return None
+        return selected[0].data(Qt.ItemDataRole.UserRole)  # The proxy forwards the row's ID from the source model
+
+    def selected_ids(self, table):
+        """
+        Return the IDs of all rows selected in a table view.
+
+        Args:
+            table (QTableView): One of the tasks, milestones, or people views.
+
+        Returns:
+            list: The selected entities' IDs, in selection order; empty if nothing is selected.
+        """
+        return [index.data(Qt.ItemDataRole.UserRole) for index in table.selectionModel().selectedRows()]
+
+    def run_form_dialog(self, title, fields):
+        """
+        Show a modal form of line edits with OK/Cancel buttons.
+
+        Args:
+            title (str): Window title.
+            fields (list): (key, label, initial text, placeholder text or None) tuples, in display order.
+
+        Returns:
+            dict or None: Each key mapped to its line edit's text, or None if the dialog was cancelled.
+        """
+        dialog = QDialog(self)
+        dialog.setWindowTitle(title)
+        layout = QFormLayout(dialog)
+
+        inputs = {}
+        for key, label, text, placeholder in fields:
+            line_edit = QLineEdit(text)
+            if placeholder:
+                line_edit.setPlaceholderText(placeholder)
+            layout.addRow(label, line_edit)
+            inputs[key] = line_edit
+
+        # Add OK/Cancel buttons
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        buttons.accepted.connect(dialog.accept)
+        buttons.rejected.connect(dialog.reject)
+        layout.addRow(buttons)
+
+        if not dialog.exec():
+            return None
+        return {key: line_edit.text() for key, line_edit in inputs.items()}
 
     def setup_gantt_chart(self):
         """
         Initialize the matplotlib-based Gantt chart canvas and add it to the UI layout.
         """
         # Create matplotlib figure and canvas
-        self.figure, self.ax = plt.subplots(figsize=(8, 4))  # Create figure with specified size
+        # Constrained layout fits the axes to their labels as part of each draw, including after a resize
+        self.figure, self.ax = plt.subplots(figsize=(8, 4), layout='constrained')  # Create figure with specified size
         self.canvas = FigureCanvas(self.figure)  # Create canvas for rendering the chart
+        # Task bars and labels are animated artists, blitted over a cached background of the static chart
+        self.gantt_bars = {}  # Task ID -> bar Rectangle
+        self.gantt_labels = {}  # Task ID -> title Text next to the bar
+        self.gantt_container = None  # BarContainer holding the bars, reused while the bar count is unchanged
+        self.gantt_layout = None  # (id, title) per row of the current full draw
+        self.gantt_background = None  # Axes pixels without the animated artists
+        self.canvas.mpl_connect('draw_event', self.on_gantt_draw)
+        # Static decoration is set up once; refreshes only touch the task artists and the y-axis ticks
+        self.ax.set_xlabel('Date')  # Set x-axis label
+        self.ax.set_ylabel('Tasks')  # Set y-axis label
+        self.ax.set_title('Gantt Chart')  # Set chart title
+        self.ax.grid(True, which='both', linestyle='--', linewidth=0.5)  # Add grid
+        self.gantt_empty_text = self.ax.text(0.5, 0.5, "No tasks available", horizontalalignment='center',
+                                             verticalalignment='center', transform=self.ax.transAxes, visible=False)
         # Add canvas to the existing ganttChartLayout
         self.ganttChartLayout.addWidget(self.canvas)  # Add canvas to UI layout
-        self.figure.tight_layout()  # Adjust layout to fit
         self.refresh_gantt_chart()  # Populate the chart with initial data
 
+    def on_gantt_draw(self, event):
+        """
+        Capture the static chart after every full draw and paint the animated task artists over it.
+
+        Args:
+            event (DrawEvent): matplotlib draw event.
+        """
+        self.gantt_background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.draw_gantt_artists()
+
+    def request_gantt_draw(self):
+        """
+        Schedule a full redraw of the chart for the next event-loop iteration.
+
+        Requests made before it runs are merged into one render. Until then the cached background no longer
+        matches the chart, so in-place updates wait for the redraw.
+        """
+        self.gantt_background = None  # on_gantt_draw captures the new one
+        self.canvas.draw_idle()
+
+    def draw_gantt_artists(self):
+        """
+        Draw the task bars and labels onto the canvas buffer.
+        """
+        for artist in (*self.gantt_bars.values(), *self.gantt_labels.values()):
+            self.ax.draw_artist(artist)
+
+    def parse_gantt_dates(self, tasks):
+        """
+        Parse all task start and due dates at once as NumPy datetime64 arrays.
+
+        Tasks whose dates are not valid YYYY-MM-DD strings are logged and left out.
+
+        Args:
+            tasks (list): Tasks to parse.
+
+        Returns:
+            tuple: (row indices of the valid tasks, start dates, due dates), the dates as datetime64[D] arrays.
+        """
+        rows = [i for i, task in enumerate(tasks) if self.DATE_RE.fullmatch(task.start_date or '') and
+                self.DATE_RE.fullmatch(task.due_date or '')]
+        try:
+            starts = np.array([tasks[i].start_date for i in rows], dtype='datetime64[D]')  # Parsed in C
+            dues = np.array([tasks[i].due_date for i in rows], dtype='datetime64[D]')
+        except ValueError:  # A well-shaped but impossible date such as 2025-13-01; find it one by one
+            rows = [i for i in rows if self.is_parseable_date(tasks[i].start_date) and
+                    self.is_parseable_date(tasks[i].due_date)]
+            starts = np.array([tasks[i].start_date for i in rows], dtype='datetime64[D]')
+            dues = np.array([tasks[i].due_date for i in rows], dtype='datetime64[D]')
+        if len(rows) != len(tasks):
+            for i in set(range(len(tasks))).difference(rows):
+                self.logger.error("Invalid date format for task %s: %s / %s", tasks[i].title, tasks[i].start_date,
+                                  tasks[i].due_date)
+        return np.array(rows, dtype=int), starts, dues
+
+    @staticmethod
+    def to_qdate(value):
+        """
+        Convert a stored YYYY-MM-DD date string to a QDate by slicing out its fields.
+
+        Much cheaper than QDate.fromString, which interprets the format pattern on every call.
+
+        Args:
+            value (str): Date string in YYYY-MM-DD format.
+
+        Returns:
+            QDate: The date; invalid if the string is malformed.
+        """
+        try:
+            return QDate(int(value[0:4]), int(value[5:7]), int(value[8:10]))
+        except (TypeError, ValueError):
+            return QDate()
+
+    @staticmethod
+    def is_parseable_date(value):
+        """
+        Check whether NumPy can parse a date string.
+
+        Args:
+            value (str): Date string.
+
+        Returns:
+            bool: True if the string is a valid calendar date.
+        """
+        try:
+            np.datetime64(value, 'D')
+            return True
+        except ValueError:
+            return False
+
+    def remove_gantt_artists(self):
+        """
+        Remove the task bars and labels from the chart.
+        """
+        if self.gantt_container is not None:
+            self.gantt_container.remove()  # Removes the bars and drops the container from the axes
+            self.gantt_container = None
+        for label in self.gantt_labels.values():
+            label.remove()
+        self.gantt_bars = {}
+        self.gantt_labels = {}
+
+    def update_gantt_in_place(self, tasks):
+        """
+        Move the existing bars to the tasks' current dates and blit them, without a full redraw.
+
+        Only possible when the chart shows the same tasks with the same titles and every bar still fits
+        the current date axis.
+
+        Args:
+            tasks (list): Tasks in chart row order.
+
+        Returns:
+            bool: True if the chart was updated, False if a full redraw is needed.
+        """
+        if self.gantt_background is None or [(task.id, task.title) for task in tasks] != self.gantt_layout:
+            return False
+        rows, starts, dues = self.parse_gantt_dates(tasks)
+        if len(rows) != len(tasks):
+            return False  # The full redraw skips the invalid task
+        lefts = mdates.date2num(starts)
+        rights = mdates.date2num(dues)
+        x_min, x_max = self.ax.get_xlim()
+        if lefts.min() < x_min or rights.max() > x_max:
+            return False
+        for task, left, right in zip(tasks, lefts, rights):
+            self.gantt_bars[task.id].set_x(left)
+            self.gantt_bars[task.id].set_width(right - left)
+            self.gantt_labels[task.id].set_x(left)
+        self.canvas.restore_region(self.gantt_background)
+        self.draw_gantt_artists()
+        self.canvas.blit(self.ax.bbox)
+        return True
+
     def refresh_gantt_chart(self):
         """
-        Refresh the Gantt chart with the latest task data.
+        Redraw the Gantt chart from the task rows last loaded for the tasks table.
+        """
+        if self.task_rows is not None:  # Until the first load arrives; populate_tasks_table schedules the draw
+            self.draw_gantt_chart([task for task, _, _ in self.task_rows])
+
+    def draw_gantt_chart(self, tasks):
+        """
+        Draw the Gantt chart for the given tasks.
 
         Displays tasks as horizontal bars based on start and due dates. Shows a message if no tasks are available.
+        When only task dates changed, the bars are moved and blitted instead of redrawing the whole figure.
+
+        Args:
+            tasks (list): Tasks in chart row order.
 
         Raises:
-            sqlite3.Error: If a database error occurs.
-            Exception: For other unexpected errors.
+            Exception: For unexpected drawing errors.
         """
         try:
-            self.ax.clear()  # Clear previous chart content
-            tasks = self.repository.get_all_tasks()  # Fetch all tasks
+            if self.update_gantt_in_place(tasks):
+                self.logger.info("Updated Gantt chart in place")
+                return
+            self.gantt_layout = None
             if not tasks:
                 # Display message if no tasks are available
-                self.ax.text(0.5, 0.5, "No tasks available", horizontalalignment='center', verticalalignment='center',
-                             transform=self.ax.transAxes)
+                self.remove_gantt_artists()
+                self.gantt_empty_text.set_visible(True)
                 self.ax.set_axis_off()  # Hide axes
-                self.canvas.draw()  # Redraw canvas
+                self.request_gantt_draw()  # Redraw canvas
                 self.logger.info("No tasks to display in Gantt chart")
                 return
 
-            y_positions = range(len(tasks))  # Y positions for tasks
-            for i, task in enumerate(tasks):
-                try:
-                    start_date = datetime.strptime(task.start_date, '%Y-%m-%d')  # Parse start date
-                    due_date = datetime.strptime(task.due_date, '%Y-%m-%d')  # Parse due date
-                    duration = (due_date - start_date).days  # Calculate task duration
-                    # Plot task as a horizontal bar
-                    self.ax.barh(i, duration, left=start_date, height=0.4, align='center', color='#3498db')
-                    # Add task title next to bar
-                    self.ax.text(start_date, i, task.title, va='center', ha='left', color='black', fontsize=8)
-                except ValueError as ve:
-                    self.logger.error(f"Invalid date format for task {task.title}: {ve}")
-                    continue
-            self.ax.set_yticks(y_positions)  # Set y-axis ticks
-            self.ax.set_yticklabels([task.title for task in tasks])  # Set y-axis labels
-            self.ax.set_xlabel('Date')  # Set x-axis label
-            self.ax.set_ylabel('Tasks')  # Set y-axis label
-            self.ax.set_title('Gantt Chart')  # Set chart title
-            self.ax.grid(True, which='both', linestyle='--', linewidth=0.5)  # Add grid
+            self.gantt_empty_text.set_visible(False)
+            self.ax.set_axis_on()  # Axes may have been hidden by the "No tasks" message
+            rows, starts, dues = self.parse_gantt_dates(tasks)  # Tasks with invalid dates are skipped
+            durations = (dues - starts).astype(int)  # Task durations in days
+            lefts = mdates.date2num(starts)
+            if self.gantt_container is not None and len(self.gantt_container) == len(rows):
+                # Same number of bars: move and relabel the existing artists
+                bars, labels = self.gantt_container.patches, list(self.gantt_labels.values())
+                for bar, label, row, left, duration in zip(bars, labels, rows, lefts, durations):
+                    bar.set_bounds(left, row - 0.2, duration, 0.4)
+                    label.set_position((left, row))
+                    label.set_text(tasks[row].title)
+            else:
+                self.remove_gantt_artists()
+                # Plot all tasks with one horizontal bar call
+                self.gantt_container = self.ax.barh(rows, durations, left=starts, height=0.4, align='center',
+                                                    color='#3498db')
+                bars = self.gantt_container.patches
+                # Add task titles next to bars; clipped to the axes so blitting never leaves stale pixels
+                labels = [self.ax.text(left, row, tasks[row].title, va='center', ha='left', color='black', fontsize=8,
+                                       clip_on=True) for row, left in zip(rows, lefts)]
+                for artist in (*bars, *labels):
+                    artist.set_animated(True)
+            self.ax.relim()  # Data limits follow the current bars only, not removed or moved ones
+            self.ax.autoscale_view()
+            self.gantt_bars = {tasks[row].id: bar for row, bar in zip(rows, bars)}
+            self.gantt_labels = {tasks[row].id: label for row, label in zip(rows, labels)}
+            self.ax.set_yticks(range(len(tasks)), [task.title for task in tasks])  # Y positions and labels for tasks
             self.figure.autofmt_xdate()  # Rotate date labels
-            self.figure.tight_layout()  # Adjust layout
-            self.canvas.draw()  # Redraw canvas
+            if len(self.gantt_bars) == len(tasks):  # Tasks with invalid dates always take the full redraw
+                self.gantt_layout = [(task.id, task.title) for task in tasks]
+            self.request_gantt_draw()  # Redraw canvas; on_gantt_draw caches the background and paints the bars
             self.logger.info("Refreshed Gantt chart")
-        except (sqlite3.Error, Exception) as e:
-            self.logger.error(f"Error refreshing Gantt chart: {e}")
+        except Exception as e:
+            self.logger.error("Error refreshing Gantt chart: %s", e)
             self.show_error(f"Error refreshing Gantt chart: {e}")
 
     def load_initial_window(self):
@@ -170,105 +554,85 @@ class ProjectManagementGUI(QMainWindow):
         try:
             self.contentTabs.setVisible(True)  # Show content tabs
             self.refresh_all_tabs()  # Refresh all tables
-            self.logger.info(f"Loaded Tasks")
+            self.logger.info("Loaded Tasks")
         except sqlite3.Error as e:
             self.show_error(f"Error loading tasks: {e}")
 
     def refresh_all_tabs(self):
         """
         Refresh all tables (Tasks, Milestones, People) and the Gantt chart.
+
+        The three fetches run on the thread pool; each view updates as soon as its own data arrives. The Gantt
+        chart and the milestones calendar are drawn from the tasks fetch.
         """
-        self.refresh_tasks_table()  # Refresh tasks table
+        self.refresh_tasks_table()  # Refresh tasks table, Gantt chart, and calendar
         self.refresh_milestones_table()  # Refresh milestones table
         self.refresh_people_table()  # Refresh people table
-        self.refresh_gantt_chart()  # Refresh Gantt chart
 
-    def refresh_tasks_table(self, filter_text=""):
+    def refresh_tasks_table(self):
         """
-        Refresh the tasks table with the latest data, optionally filtered by title.
+        Reload the tasks on a worker thread for the tasks table, the Gantt chart, and the milestones calendar.
 
-        Args:
-            filter_text (str): Text to filter tasks by title (default: "").
+        The current filter is kept by the view's proxy model.
+        """
+        # Fetch all tasks with the assigned person's name in one query instead of one lookup per task
+        self.run_in_background("tasks", self.repository.get_all_tasks_with_names, self.populate_tasks_table,
+                               "Error refreshing tasks")
 
-        Raises:
-            sqlite3.Error: If a database error occurs.
-            LookupError: If a person lookup fails.
+    def populate_tasks_table(self, rows):
         """
-        try:
-            self.tasksTable.setRowCount(0)  # Clear existing rows
-            tasks = self.repository.get_all_tasks()  # Fetch all tasks
-            for task in tasks:
-                person = self.repository.get_person(task.person_id)  # Get assigned person
-                if filter_text.lower() not in task.title.lower():  # Apply filter
-                    continue
-                row = self.tasksTable.rowCount()
-                self.tasksTable.insertRow(row)  # Add new row
-                # Populate table with task data
-                self.tasksTable.setItem(row, 0, QTableWidgetItem(str(task.id)))
-                self.tasksTable.setItem(row, 1, QTableWidgetItem(task.title))
-                self.tasksTable.setItem(row, 2, QTableWidgetItem(task.status))
-                self.tasksTable.setItem(row, 3, QTableWidgetItem(task.priority))
-                self.tasksTable.setItem(row, 4, QTableWidgetItem(task.start_date))
-                self.tasksTable.setItem(row, 5, QTableWidgetItem(task.due_date))
-                self.tasksTable.setItem(row, 6, QTableWidgetItem(person.name))
-            self.logger.info(f"Refreshed tasks table")
-        except (sqlite3.Error, LookupError) as e:
-            self.show_error(f"Error refreshing tasks: {e}")
+        Show freshly loaded tasks in the tasks table and schedule the Gantt chart and calendar redraws from them.
+
+        Args:
+            rows (list): (Task, person name, milestone name) tuples.
+        """
+        self.task_rows = rows  # Shared by the Gantt chart and the calendar, so they need no fetch of their own
+        self.milestone_days = None  # Rebuilt from the new rows when next needed
+        self.taskModel.set_rows([
+            (task.id, task.title, task.status, task.priority, task.start_date, task.due_date, person_name)
+            for task, person_name, _ in rows
+        ])
+        self.schedule_gantt_refresh()
+        self.schedule_calendar_refresh()
+        self.logger.info("Refreshed tasks table")
+
+    def refresh_milestones_table(self):
+        """
+        Reload the milestones table and calendar on a worker thread, keeping the current filter.
+        """
+        self.milestone_options = None  # Reload on next use if the fetch fails rather than offer stale entries
+        self.run_in_background("milestones", self.repository.get_all_milestones, self.populate_milestones_table,
+                               "Error refreshing milestones")
 
-    def refresh_milestones_table(self, filter_text=""):
+    def populate_milestones_table(self, milestones):
         """
-        Refresh the milestones table with the latest data, optionally filtered by name.
+        Show freshly loaded milestones in the milestones table.
 
         Args:
-            filter_text (str): Text to filter milestones by name (default: "").
+            milestones (list): Milestone objects.
+        """
+        self.milestoneModel.set_rows([(milestone.id, milestone.name) for milestone in milestones])
+        self.milestone_options = [(f"{milestone.id}: {milestone.name}", milestone.id) for milestone in milestones]
+        self.logger.info("Refreshed milestones table")
 
-        Raises:
-            sqlite3.Error: If a database error occurs.
-            LookupError: If a milestone lookup fails.
+    def refresh_people_table(self):
         """
-        try:
-            self.milestonesTable.setRowCount(0)  # Clear existing rows
-            milestones = self.repository.get_all_milestones()  # Fetch all milestones
-            for milestone in milestones:
-                if filter_text.lower() not in milestone.name.lower():  # Apply filter
-                    continue
-                row = self.milestonesTable.rowCount()
-                self.milestonesTable.insertRow(row)  # Add new row
-                # Populate table with milestone data
-                self.milestonesTable.setItem(row, 0, QTableWidgetItem(str(milestone.id)))
-                self.milestonesTable.setItem(row, 1, QTableWidgetItem(milestone.name))
-            self.refresh_milestones_calendar(filter_text)
-            self.logger.info(f"Refreshed milestones table")
-        except (sqlite3.Error, LookupError) as e:
-            self.show_error(f"Error refreshing milestones: {e}")
+        Reload the people table on a worker thread; the current filter is kept by the view's proxy model.
+        """
+        self.person_options = None  # Reload on next use if the fetch fails rather than offer stale entries
+        self.run_in_background("people", self.repository.get_all_persons, self.populate_people_table,
+                               "Error refreshing people")
 
-    def refresh_people_table(self, filter_text=""):
+    def populate_people_table(self, people):
         """
-        Refresh the people table with the latest data, optionally filtered by name.
+        Show freshly loaded people in the people table.
 
         Args:
-            filter_text (str): Text to filter persons by name (default: "").
-
-        Raises:
-            sqlite3.Error: If a database error occurs.
-            LookupError: If a person lookup fails.
+            people (list): Person objects.
         """
-        try:
-            self.peopleTable.setRowCount(0)  # Clear existing rows
-            people = self.repository.get_all_persons()  # Fetch all persons
-            for person in people:
-                if filter_text.lower() not in person.name.lower():  # Apply filter
-                    continue
-                row = self.peopleTable.rowCount()
-                self.peopleTable.insertRow(row)  # Add new row
-                # Populate table with person data
-                self.peopleTable.setItem(row, 0, QTableWidgetItem(str(person.id)))
-                self.peopleTable.setItem(row, 1, QTableWidgetItem(person.name))
-                self.peopleTable.setItem(row, 2, QTableWidgetItem(person.email))
-                self.peopleTable.setItem(row, 3, QTableWidgetItem(person.role))
-            self.logger.info(f"Refreshed people table")
-        except (sqlite3.Error, LookupError) as e:
-            self.show_error(f"Error refreshing people: {e}")
+        self.personModel.set_rows([(person.id, person.name, person.email, person.role) for person in people])
+        self.person_options = [(f"{person.id}: {person.name}", person.id) for person in people]
+        self.logger.info("Refreshed people table")
 
     def show_people(self):
         """
@@ -300,16 +664,18 @@ class ProjectManagementGUI(QMainWindow):
         Args:
             text (str): Text to filter tasks by title.
         """
-        self.refresh_tasks_table(text)  # Refresh tasks table with filter
+        self.tasksTable.model().setFilterFixedString(text)  # Filter the loaded rows; no database access
 
     def filter_milestones(self, text):
         """
-        Filter the milestones table based on the provided text.
+        Filter the milestones table and calendar based on the provided text.
 
         Args:
             text (str): Text to filter milestones by name.
         """
-        self.refresh_milestones_table(text)  # Refresh milestones table with filter
+        self.milestone_filter = text
+        self.milestonesTable.model().setFilterFixedString(text)  # Filter the loaded rows; no database access
+        self.refresh_milestones_calendar(text)  # Calendar highlights follow the filter
 
     def filter_people(self, text):
         """
@@ -318,7 +684,7 @@ class ProjectManagementGUI(QMainWindow):
         Args:
             text (str): Text to filter persons by name.
         """
-        self.refresh_people_table(text)  # Refresh people table with filter
+        self.peopleTable.model().setFilterFixedString(text)  # Filter the loaded rows; no database access
 
     def open_create_task_dialog(self):
         """
@@ -351,14 +717,14 @@ class ProjectManagementGUI(QMainWindow):
         due_date_input.setDisplayFormat("yyyy-MM-dd")  # Set date format
         due_date_input.setDate(QDate.currentDate())  # Default to current date
         person_id_input = QComboBox()
-        people = self.repository.get_all_persons()  # Fetch all persons
-        for person in people:
-            person_id_input.addItem(f"{person.id}: {person.name}", person.id)  # Add person options
         milestone_id_input = QComboBox()
-        milestone_id_input.addItem("None", None)  # Add None option for milestone
-        milestones = self.repository.get_all_milestones()  # Fetch all milestones
-        for milestone in milestones:
-            milestone_id_input.addItem(f"{milestone.id}: {milestone.name}", milestone.id)  # Add milestone options
+        try:
+            self.fill_combo(person_id_input, self.get_person_options())  # Add cached person options
+            # Add None option for milestone, then the cached milestone options
+            self.fill_combo(milestone_id_input, [("None", None), *self.get_milestone_options()])
+        except sqlite3.Error as e:
+            self.show_error(f"Error loading people and milestones: {e}")
+            return
 
         # Add fields to layout
         layout.addRow("Title:", title_input)
@@ -403,9 +769,8 @@ class ProjectManagementGUI(QMainWindow):
                     person_id=int(person_id),
                     milestone_id=milestone_id
                 )
-                self.refresh_tasks_table()  # Refresh tasks table
-                self.refresh_gantt_chart()  # Refresh Gantt chart
-                self.logger.info(f"Created task: {title}")
+                self.refresh_tasks_table()  # Refresh tasks table, Gantt chart, and calendar
+                self.logger.info("Created task: %s", title)
             except (ValueError, sqlite3.Error, LookupError) as e:
                 self.show_error(f"Error creating task: {e}")
 
@@ -420,11 +785,10 @@ class ProjectManagementGUI(QMainWindow):
             sqlite3.Error: If a database error occurs.
             LookupError: If the task or referenced entities are invalid.
         """
-        selected = self.tasksTable.selectedItems()
-        if not selected:
+        task_id = self.selected_id(self.tasksTable)
+        if task_id is None:
             self.show_error("Please select a task to update.")
             return
-        task_id = int(self.tasksTable.item(selected[0].row(), 0).text())
         try:
             task = self.repository.get_task(task_id)  # Fetch task by ID
             dialog = QDialog(self)
@@ -443,24 +807,18 @@ class ProjectManagementGUI(QMainWindow):
             start_date_input = QDateEdit()
             start_date_input.setCalendarPopup(True)
             start_date_input.setDisplayFormat("yyyy-MM-dd")
-            start_date_input.setDate(QDate.fromString(task.start_date, "yyyy-MM-dd"))  # Set current start date
+            start_date_input.setDate(self.to_qdate(task.start_date))  # Set current start date
             due_date_input = QDateEdit()
             due_date_input.setCalendarPopup(True)
             due_date_input.setDisplayFormat("yyyy-MM-dd")
-            due_date_input.setDate(QDate.fromString(task.due_date, "yyyy-MM-dd"))  # Set current due date
+            due_date_input.setDate(self.to_qdate(task.due_date))  # Set current due date
             person_id_input = QComboBox()
-            people = self.repository.get_all_persons()
-            for person in people:
-                person_id_input.addItem(f"{person.id}: {person.name}", person.id)
-            person_id_input.setCurrentText(f"{task.person_id}: {self.repository.get_person(task.person_id).name}")  # Set current person
+            self.fill_combo(person_id_input, self.get_person_options())
+            person_id_input.setCurrentIndex(person_id_input.findData(task.person_id))  # Set current person
             milestone_id_input = QComboBox()
-            milestone_id_input.addItem("None", None)
-            milestones = self.repository.get_all_milestones()
-            for milestone in milestones:
-                milestone_id_input.addItem(f"{milestone.id}: {milestone.name}", milestone.id)
+            self.fill_combo(milestone_id_input, [("None", None), *self.get_milestone_options()])
             if task.milestone_id:
-                milestone_id_input.setCurrentText(
-                    f"{task.milestone_id}: {self.repository.get_milestone(task.milestone_id).name}")  # Set current milestone
+                milestone_id_input.setCurrentIndex(milestone_id_input.findData(task.milestone_id))  # Set current milestone
 
             # Add fields to layout
             layout.addRow("Title:", title_input)
@@ -505,31 +863,28 @@ class ProjectManagementGUI(QMainWindow):
                     person_id=int(person_id),
                     milestone_id=milestone_id
                 )
-                self.refresh_tasks_table()  # Refresh tasks table
-                self.refresh_gantt_chart()  # Refresh Gantt chart
-                self.refresh_milestones_calendar()  # Refresh milestones calendar to update highlights
-                self.logger.info(f"Updated task ID: {task_id}")
+                self.refresh_tasks_table()  # Refresh tasks table, Gantt chart, and calendar
+                self.logger.info("Updated task ID: %s", task_id)
         except (ValueError, sqlite3.Error, LookupError) as e:
             self.show_error(f"Error updating task: {e}")
 
     def delete_task(self):
         """
-        Delete the selected task from the database.
+        Delete the selected tasks from the database in one transaction.
 
         Raises:
             sqlite3.Error: If a database error occurs.
+            LookupError: If a task no longer exists.
         """
-        selected = self.tasksTable.selectedItems()
-        if not selected:
+        task_ids = self.selected_ids(self.tasksTable)
+        if not task_ids:
             self.show_error("Please select a task to delete.")
             return
-        task_id = int(self.tasksTable.item(selected[0].row(), 0).text())
         try:
-            self.repository.delete_task(task_id)  # Delete task
-            self.refresh_tasks_table()  # Refresh tasks table
-            self.refresh_gantt_chart()  # Refresh Gantt chart
-            self.logger.info(f"Deleted task ID: {task_id}")
-        except sqlite3.Error as e:
+            self.repository.delete_tasks(task_ids)  # Delete all selected tasks at once
+            self.refresh_tasks_table()  # Refresh tasks table, Gantt chart, and calendar
+            self.logger.info("Deleted task IDs: %s", task_ids)
+        except (sqlite3.Error, LookupError) as e:
             self.show_error(f"Error deleting task: {e}")
 
     def export_tasks_to_csv(self):
@@ -555,32 +910,16 @@ class ProjectManagementGUI(QMainWindow):
             if not file_path:
                 return
 
-            tasks = self.repository.get_all_tasks()  # Fetch all tasks
             with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
                 writer = csv.writer(csvfile)
                 # Write CSV header
                 writer.writerow(
                     ["ID", "Title", "Description", "Status", "Priority", "Start Date", "Due Date", "Assigned Person",
                      "Milestone"])
-                for task in tasks:
-                    person = self.repository.get_person(task.person_id)  # Get assigned person
-                    # Get milestone name or "None"
-                    milestone_name = self.repository.get_milestone(
-                        task.milestone_id).name if task.milestone_id else "None"
-                    # Write task data to CSV
-                    writer.writerow([
-                        task.id,
-                        task.title,
-                        task.description,
-                        task.status,
-                        task.priority,
-                        task.start_date,
-                        task.due_date,
-                        person.name,
-                        milestone_name
-                    ])
-
-            self.logger.info(f"Exported tasks to {file_path}")
+                # Stream task rows, names already joined in, straight from the database cursor
+                writer.writerows(self.repository.iter_tasks_export())
+
+            self.logger.info("Exported tasks to %s", file_path)
             QMessageBox.information(self, "Success", f"Tasks exported to:\n{file_path}")
         except (sqlite3.Error, IOError) as e:
             self.show_error(f"Error exporting tasks: {e}")
@@ -595,28 +934,15 @@ class ProjectManagementGUI(QMainWindow):
             ValueError: If the name is missing.
             sqlite3.Error: If a database error occurs.
         """
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Create Milestone")
-        layout = QFormLayout(dialog)
-
-        name_input = QLineEdit()
-
-        layout.addRow("Name:", name_input)
-
-        # Add OK/Cancel buttons
-        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
-        buttons.accepted.connect(dialog.accept)
-        buttons.rejected.connect(dialog.reject)
-        layout.addRow(buttons)
-
-        if dialog.exec():
+        values = self.run_form_dialog("Create Milestone", [("name", "Name:", "", None)])
+        if values is not None:
             try:
-                name = name_input.text()
+                name = values["name"]
                 if not name:
                     raise ValueError("Name is required")
                 self.repository.add_milestone(name)  # Add milestone to database
                 self.refresh_milestones_table()  # Refresh milestones table
-                self.logger.info(f"Created milestone: {name}")
+                self.logger.info("Created milestone: %s", name)
             except (ValueError, sqlite3.Error) as e:
                 self.show_error(f"Error creating milestone: {e}")
 
@@ -631,54 +957,44 @@ class ProjectManagementGUI(QMainWindow):
             sqlite3.Error: If a database error occurs.
             LookupError: If the milestone is invalid.
         """
-        selected = self.milestonesTable.selectedItems()
-        if not selected:
+        milestone_id = self.selected_id(self.milestonesTable)
+        if milestone_id is None:
             self.show_error("Please select a milestone to update.")
             return
-        milestone_id = int(self.milestonesTable.item(selected[0].row(), 0).text())
         try:
             milestone = self.repository.get_milestone(milestone_id)  # Fetch milestone by ID
-            dialog = QDialog(self)
-            dialog.setWindowTitle("Update Milestone")
-            layout = QFormLayout(dialog)
-
-            name_input = QLineEdit(milestone.name)
-
-            layout.addRow("Name:", name_input)
-
-            # Add OK/Cancel buttons
-            buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
-            buttons.accepted.connect(dialog.accept)
-            buttons.rejected.connect(dialog.reject)
-            layout.addRow(buttons)
-
-            if dialog.exec():
-                name = name_input.text()
+            values = self.run_form_dialog("Update Milestone", [("name", "Name:", milestone.name, None)])
+            if values is not None:
+                name = values["name"]
                 if not name:
                     raise ValueError("Name is required")
+                if name == milestone.name:
+                    return  # Nothing edited: skip the write and the refreshes
                 self.repository.update_milestone(milestone_id, name=name)  # Update milestone
                 self.refresh_milestones_table()  # Refresh milestones table
-                self.logger.info(f"Updated milestone ID: {milestone_id}")
+                self.refresh_tasks_table()  # Task rows carry milestone names for the calendar
+                self.logger.info("Updated milestone ID: %s", milestone_id)
         except (ValueError, sqlite3.Error, LookupError) as e:
             self.show_error(f"Error updating milestone: {e}")
 
     def delete_milestone(self):
         """
-        Delete the selected milestone from the database.
+        Delete the selected milestones from the database in one transaction.
 
         Raises:
             sqlite3.Error: If a database error occurs.
+            LookupError: If a milestone no longer exists.
         """
-        selected = self.milestonesTable.selectedItems()
-        if not selected:
+        milestone_ids = self.selected_ids(self.milestonesTable)
+        if not milestone_ids:
             self.show_error("Please select a milestone to delete.")
             return
-        milestone_id = int(self.milestonesTable.item(selected[0].row(), 0).text())
         try:
-            self.repository.delete_milestone(milestone_id)  # Delete milestone
+            self.repository.delete_milestones(milestone_ids)  # Delete all selected milestones at once
             self.refresh_milestones_table()  # Refresh milestones table
-            self.logger.info(f"Deleted milestone ID: {milestone_id}")
-        except sqlite3.Error as e:
+            self.refresh_tasks_table()  # Task rows carry milestone names for the calendar
+            self.logger.info("Deleted milestone IDs: %s", milestone_ids)
+        except (sqlite3.Error, LookupError) as e:
             self.show_error(f"Error deleting milestone: {e}")
 
     def open_create_person_dialog(self):
@@ -691,36 +1007,21 @@ class ProjectManagementGUI(QMainWindow):
             ValueError: If required fields are missing.
             sqlite3.Error: If a database error occurs.
         """
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Create Person")
-        layout = QFormLayout(dialog)
-
-        name_input = QLineEdit()
-        email_input = QLineEdit()
-        role_input = QLineEdit()
-        role_input.setPlaceholderText("e.g., Developer, Manager")  # Set placeholder for role
-
-        # Add fields to layout
-        layout.addRow("Name:", name_input)
-        layout.addRow("Email:", email_input)
-        layout.addRow("Role:", role_input)
-
-        # Add OK/Cancel buttons
-        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
-        buttons.accepted.connect(dialog.accept)
-        buttons.rejected.connect(dialog.reject)
-        layout.addRow(buttons)
-
-        if dialog.exec():
+        values = self.run_form_dialog("Create Person", [
+            ("name", "Name:", "", None),
+            ("email", "Email:", "", None),
+            ("role", "Role:", "", self.ROLE_PLACEHOLDER),
+        ])
+        if values is not None:
             try:
-                name = name_input.text()
-                email = email_input.text()
-                role = role_input.text()
+                name = values["name"]
+                email = values["email"]
+                role = values["role"]
                 if not (name and email):
                     raise ValueError("Name and Email are required")
                 self.repository.add_person(name, email, role)  # Add person to database
                 self.refresh_people_table()  # Refresh people table
-                self.logger.info(f"Created person: {name}")
+                self.logger.info("Created person: %s", name)
             except (ValueError, sqlite3.Error) as e:
                 self.show_error(f"Error creating person: {e}")
 
@@ -735,62 +1036,50 @@ class ProjectManagementGUI(QMainWindow):
             sqlite3.Error: If a database error occurs.
             LookupError: If the person is invalid.
         """
-        selected = self.peopleTable.selectedItems()
-        if not selected:
+        person_id = self.selected_id(self.peopleTable)
+        if person_id is None:
             self.show_error("Please select a person to update.")
             return
-        person_id = int(self.peopleTable.item(selected[0].row(), 0).text())
         try:
             person = self.repository.get_person(person_id)  # Fetch person by ID
-            dialog = QDialog(self)
-            dialog.setWindowTitle("Update Person")
-            layout = QFormLayout(dialog)
-
-            name_input = QLineEdit(person.name)
-            email_input = QLineEdit(person.email)
-            role_input = QLineEdit(person.role if hasattr(person, 'role') else "")  # Handle optional role
-            role_input.setPlaceholderText("e.g., Developer, Manager")  # Set placeholder for role
-
-            # Add fields to layout
-            layout.addRow("Name:", name_input)
-            layout.addRow("Email:", email_input)
-            layout.addRow("Role:", role_input)
-
-            # Add OK/Cancel buttons
-            buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
-            buttons.accepted.connect(dialog.accept)
-            buttons.rejected.connect(dialog.reject)
-            layout.addRow(buttons)
-
-            if dialog.exec():
-                name = name_input.text()
-                email = email_input.text()
-                role = role_input.text()
+            values = self.run_form_dialog("Update Person", [
+                ("name", "Name:", person.name, None),
+                ("email", "Email:", person.email, None),
+                ("role", "Role:", person.role or "", self.ROLE_PLACEHOLDER),  # A stored NULL role shows as empty
+            ])
+            if values is not None:
+                name = values["name"]
+                email = values["email"]
+                role = values["role"]
                 if not (name and email):
                     raise ValueError("Name and Email are required")
+                if (name, email, role) == (person.name, person.email, person.role or ""):
+                    return  # Nothing edited: skip the write and the refreshes
                 self.repository.update_person(person_id, name, email, role)  # Update person
                 self.refresh_people_table()  # Refresh people table
-                self.logger.info(f"Updated person ID: {person_id}")
+                self.refresh_tasks_table()  # Task rows carry the assigned person's name
+                self.logger.info("Updated person ID: %s", person_id)
         except (ValueError, sqlite3.Error, LookupError) as e:
             self.show_error(f"Error updating person: {e}")
 
     def delete_person(self):
         """
-        Delete the selected person from the database.
+        Delete the selected people from the database in one transaction.
 
         Raises:
             sqlite3.Error: If a database error occurs.
+            LookupError: If a person no longer exists.
         """
-        selected = self.peopleTable.selectedItems()
-        if not selected:
+        person_ids = self.selected_ids(self.peopleTable)
+        if not person_ids:
             self.show_error("Please select a person to delete.")
             return
-        person_id = int(self.peopleTable.item(selected[0].row(), 0).text())
         try:
-            self.repository.delete_person(person_id)  # Delete person
+            self.repository.delete_persons(person_ids)  # Delete all selected people at once
             self.refresh_people_table()  # Refresh people table
-            self.logger.info(f"Deleted person ID: {person_id}")
-        except sqlite3.Error as e:
+            self.refresh_tasks_table()  # Task rows carry the assigned person's name
+            self.logger.info("Deleted person IDs: %s", person_ids)
+        except (sqlite3.Error, LookupError) as e:
             self.show_error(f"Error deleting person: {e}")
 
     def show_error(self, message):
@@ -803,88 +1092,135 @@ class ProjectManagementGUI(QMainWindow):
         self.logger.error(message)
         QMessageBox.critical(self, "Error", str(message))  # Show error dialog
 
+    def julian_day(self, value, cache):
+        """
+        Return the Julian day number of a 'yyyy-MM-dd' string, memoized in the given dict.
+
+        Args:
+            value (str): Date string as stored in the database.
+            cache (dict): Date string -> Julian day or None, shared across one index build.
+
+        Returns:
+            int or None: The Julian day, or None if the string is not a valid date.
+        """
+        try:
+            return cache[value]
+        except KeyError:
+            date = self.to_qdate(value)
+            day = cache[value] = date.toJulianDay() if date.isValid() else None
+            return day
+
+    def get_milestone_days(self):
+        """
+        Return the per-day index of milestone tasks, building it from the loaded task rows on first use.
+
+        Days are keyed by Julian day number (QDate.toJulianDay), so walking a task's date range is plain integer
+        arithmetic; QDates are only created for the dates the calendar actually updates.
+
+        Returns:
+            dict: Julian day -> list of (milestone name, task title) for every task with a milestone spanning
+                that day, in task order.
+        """
+        if self.milestone_days is None:
+            days = {}
+            julian_days = {}  # Date string -> Julian day or None, so dates shared by many tasks are parsed once
+            for task, _, milestone_name in self.task_rows or ():
+                if milestone_name is None:
+                    continue
+                entry = (milestone_name, task.title)
+                start_day = self.julian_day(task.start_date, julian_days)
+                due_day = self.julian_day(task.due_date, julian_days)
+                if start_day is None or due_day is None:
+                    continue  # An invalid date has no Julian day to walk from
+                for day in range(start_day, due_day + 1):
+                    days.setdefault(day, []).append(entry)
+            self.milestone_days = days
+        return self.milestone_days
+
+    def calendar_page_days(self):
+        """
+        Return the Julian days the calendar's current page can show.
+
+        The six-week grid starts at most a week before the first of the shown month and ends at most two weeks
+        after its last day.
+
+        Returns:
+            range: Julian day numbers covering every cell of the page.
+        """
+        first = QDate(self.milestonesCalendar.yearShown(), self.milestonesCalendar.monthShown(), 1)
+        return range(first.toJulianDay() - 7, first.addMonths(1).toJulianDay() + 14)
+
     def refresh_milestones_calendar(self, filter_text=""):
         """
-        Refresh the milestones calendar with the latest data, optionally filtered by name.
+        Refresh the milestones calendar from the loaded task rows, optionally filtered by milestone name.
 
-        Highlights dates with milestones and adds tooltips with milestone names.
+        Highlights dates with milestones and adds tooltips with milestone names. The days come from the
+        per-day index, so no database access is needed and a filter change does not walk the task date
+        ranges again. Only the days the current page can show are considered, so the work does not grow with
+        the project's history, and only dates whose highlight changed since the last refresh are touched. All
+        days of a task share one format object.
 
         Args:
             filter_text (str): Text to filter milestones by name (default: "").
-
-        Raises:
-            sqlite3.Error: If a database error occurs.
-            LookupError: If a milestone lookup fails.
         """
+        filter_text = filter_text.lower()
+        date_tooltips = {}  # Julian day -> tooltip of the highlight it should carry
+        milestone_days = self.get_milestone_days()
+        for day in self.calendar_page_days():
+            entries = milestone_days.get(day)
+            if entries is None:
+                continue
+            for milestone_name, task_title in reversed(entries):  # The last matching task wins, as before
+                if filter_text in milestone_name.lower():
+                    date_tooltips[day] = f"Milestone: {milestone_name}\nTask: {task_title}"
+                    break
+
+        formats = {}  # Tooltip -> shared QTextCharFormat
+        self.milestonesCalendar.setUpdatesEnabled(False)  # One repaint for the whole batch
         try:
-            # Clear existing formats by applying a default QTextCharFormat
             default_format = QTextCharFormat()
-            self.milestonesCalendar.setDateTextFormat(QDate(), default_format)
-
-            tasks = self.repository.get_all_tasks()
-            date_formats = {}
-            for task in tasks:
-                if task.milestone_id:
-                    milestone = self.repository.get_milestone(task.milestone_id)
-                    if filter_text.lower() not in milestone.name.lower():
-                        continue
-                    start_date = QDate.fromString(task.start_date, "yyyy-MM-dd")
-                    due_date = QDate.fromString(task.due_date, "yyyy-MM-dd")
-                    current_date = start_date
-                    while current_date <= due_date:
-                        format = QTextCharFormat()
-                        format.setBackground(QColor("#3498db"))
-                        format.setForeground(QColor("#ffffff"))
-                        format.setToolTip(f"Milestone: {milestone.name}\nTask: {task.title}")
-                        date_formats[current_date] = format
-                        current_date = current_date.addDays(1)
-
-            # Apply formats to calendar
-            for date, format in date_formats.items():
-                self.milestonesCalendar.setDateTextFormat(date, format)
-
-            self.logger.info("Refreshed milestones calendar")
-        except (sqlite3.Error, LookupError) as e:
-            self.show_error(f"Error refreshing milestones calendar: {e}")
+            for day in self.calendar_tooltips.keys() - date_tooltips.keys():  # No longer highlighted
+                self.milestonesCalendar.setDateTextFormat(QDate.fromJulianDay(day), default_format)
+            for day, tooltip in date_tooltips.items():
+                if self.calendar_tooltips.get(day) == tooltip:
+                    continue  # Already carries this highlight
+                format = formats.get(tooltip)
+                if format is None:
+                    format = formats[tooltip] = QTextCharFormat()
+                    format.setBackground(QColor("#3498db"))
+                    format.setForeground(QColor("#ffffff"))
+                    format.setToolTip(tooltip)
+                self.milestonesCalendar.setDateTextFormat(QDate.fromJulianDay(day), format)
+        finally:
+            self.milestonesCalendar.setUpdatesEnabled(True)
+        self.calendar_tooltips = date_tooltips
+
+        self.logger.info("Refreshed milestones calendar")
+
     def show_milestone_details(self, date):
         """
         Display details of milestones associated with the selected date in a dialog.
 
+        Looks the date up in the per-day index the calendar was drawn from.
+
         Args:
             date (QDate): The date selected in the milestonesCalendar.
-
-        Raises:
-            sqlite3.Error: If a database error occurs.
-            LookupError: If a milestone lookup fails.
         """
-        try:
-            selected_date = date.toString("yyyy-MM-dd")
-            tasks = self.repository.get_all_tasks()
-            milestones_on_date = []
-
-            # Find tasks with milestones that fall on the selected date
-            for task in tasks:
-                if task.milestone_id:
-                    task_start = QDate.fromString(task.start_date, "yyyy-MM-dd")
-                    task_due = QDate.fromString(task.due_date, "yyyy-MM-dd")
-                    if task_start <= date <= task_due:
-                        milestone = self.repository.get_milestone(task.milestone_id)
-                        milestones_on_date.append((milestone.name, task.title))
-
-            if not milestones_on_date:
-                QMessageBox.information(self, "Milestone Details", f"No milestones on {selected_date}")
-                return
+        selected_date = date.toString("yyyy-MM-dd")
+        milestones_on_date = self.get_milestone_days().get(date.toJulianDay())
+
+        if not milestones_on_date:
+            QMessageBox.information(self, "Milestone Details", f"No milestones on {selected_date}")
+            return
 
-            # Format milestone details
-            details = f"Milestones on {selected_date}:\n\n"
-            for milestone_name, task_title in milestones_on_date:
-                details += f"Milestone: {milestone_name}\nAssociated Task: {task_title}\n\n"
+        # Format milestone details
+        details = f"Milestones on {selected_date}:\n\n"
+        for milestone_name, task_title in milestones_on_date:
+            details += f"Milestone: {milestone_name}\nAssociated Task: {task_title}\n\n"
 
-            # Show details in a dialog
-            QMessageBox.information(self, "Milestone Details", details)
-            self.logger.info(f"Displayed milestone details for date: {selected_date}")
-        except (sqlite3.Error, LookupError) as e:
-            self.show_error(f"Error displaying milestone details: {e}")
+        # Show details in a dialog
+        QMessageBox.information(self, "Milestone Details", details)
+        self.logger.info("Displayed milestone details for date: %s", selected_date)
 
 
 def run_gui():
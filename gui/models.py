@@ -0,0 +1,64 @@
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+
+class RowTableModel(QAbstractTableModel):
+    """
+    A read-only table model over a plain list of row tuples.
+
+    The view only asks for the cells it paints, so refreshing the table replaces one Python list instead of
+    creating an item object per cell. Each row tuple starts with the entity ID, which is not shown as a column
+    but is returned for Qt.ItemDataRole.UserRole.
+    """
+
+    HEADERS = ()  # Column headers, one per tuple position after the ID
+
+    def __init__(self, parent=None):
+        """
+        Initialize an empty model.
+
+        Args:
+            parent (QObject): Optional Qt parent.
+        """
+        super().__init__(parent)
+        self._rows = []
+
+    def set_rows(self, rows):
+        """
+        Replace all rows and notify attached views.
+
+        Args:
+            rows (list): Row tuples of the ID followed by the values in HEADERS order.
+        """
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[index.row()][index.column() + 1]  # Skip the ID
+        if role == Qt.ItemDataRole.UserRole:
+            return self._rows[index.row()][0]
+        return None  # Qt asks for every role on paint; only the two above are used
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+
+class TaskTableModel(RowTableModel):
+    HEADERS = ("Title", "Status", "Priority", "Start Date", "Due Date", "Assigned Person")
+
+
+class MilestoneTableModel(RowTableModel):
+    HEADERS = ("Name",)
+
+
+class PersonTableModel(RowTableModel):
+    HEADERS = ("Name", "Email", "Role")
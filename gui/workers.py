@@ -0,0 +1,40 @@
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+
+class FetchSignals(QObject):
+    """
+    Signals emitted by a FetchJob. The object is created on the GUI thread, so connected slots run there.
+    """
+
+    done = pyqtSignal(object)  # Result of the fetch callable
+    failed = pyqtSignal(str)  # Error message if the fetch raised
+
+
+class FetchJob(QRunnable):
+    """
+    Run a database fetch on a QThreadPool worker and hand the result back to the GUI thread.
+
+    The fetch must not touch any widgets; only the slots connected to the signals may do that.
+    """
+
+    def __init__(self, fetch):
+        """
+        Initialize the job.
+
+        Args:
+            fetch (callable): Zero-argument callable returning the rows to deliver.
+        """
+        super().__init__()
+        self.fetch = fetch
+        self.signals = FetchSignals()
+
+    def run(self):
+        """
+        Call the fetch and emit its result, or its error message if it raised.
+        """
+        try:
+            result = self.fetch()
+        except Exception as e:  # An exception escaping a worker thread would abort the application
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.done.emit(result)
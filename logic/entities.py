@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Person:
     """
     A data class representing a person in the project management system.
@@ -19,7 +19,7 @@ class Person:
     role: str  # Can be any string, including empty for no role
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Task:
     """
     A data class representing a task in the project management system.
@@ -46,7 +46,7 @@ class Task:
     milestone_id: Optional[int]  # Optional to allow tasks without a milestone
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Milestone:
     """
     A data class representing a milestone in the project management system.
@@ -0,0 +1,212 @@
+import sqlite3
+from contextlib import closing
+
+import pytest
+
+from design_pattern.repository.repository import ProjectManagementRepository
+
+
+@pytest.fixture
+def repository(tmp_path):
+    """
+    Provide a repository on a fresh database file, closed after the test.
+    """
+    repository = ProjectManagementRepository(str(tmp_path / "test.db"))
+    yield repository
+    repository.close()
+
+
+@pytest.fixture
+def person(repository):
+    return repository.add_person("Ann", "ann@example.com", "Developer")
+
+
+@pytest.fixture
+def milestone(repository):
+    return repository.add_milestone("Release")
+
+
+def task_row(person_id, milestone_id=None, **changes):
+    """
+    Build an add_tasks row of valid values, with the given fields replaced.
+    """
+    row = {"title": "Design", "description": "d", "status": "ToDo", "priority": "High",
+           "start_date": "2025-01-01", "due_date": "2025-01-05", "person_id": person_id, "milestone_id": milestone_id}
+    row.update(changes)
+    return tuple(row.values())
+
+
+@pytest.mark.parametrize("changes", [
+    {"status": None},
+    {"priority": None},
+    {"start_date": None},
+    {"due_date": None},
+    {"status": "Blocked"},
+    {"priority": "Urgent"},
+    {"start_date": "2025-02-30"},
+    {"due_date": "05/01/2025"},
+])
+def test_add_tasks_rejects_what_add_task_rejects(repository, person, changes):
+    row = task_row(person.id, **changes)
+    with pytest.raises(ValueError):
+        repository.add_task(*row)
+    with pytest.raises(ValueError):
+        repository.add_tasks([task_row(person.id), row])
+    assert repository.get_all_tasks() == []
+
+
+def test_add_tasks_rejects_missing_foreign_keys(repository, person):
+    with pytest.raises(LookupError):
+        repository.add_tasks([task_row(person.id), task_row(999)])
+    with pytest.raises(LookupError):
+        repository.add_tasks([task_row(person.id, milestone_id=999)])
+    assert repository.get_all_tasks() == []
+
+
+def test_atomic_rolls_back_on_error(repository, person):
+    with pytest.raises(RuntimeError):
+        with repository.atomic():
+            added = repository.add_person("Bob", "bob@example.com", None)
+            repository.update_person(person.id, "Ann Renamed", person.email)
+            assert repository.get_person(added.id) == added  # Visible inside the transaction
+            raise RuntimeError("abort")
+    assert [p.name for p in repository.get_all_persons()] == ["Ann"]
+    assert repository.get_person(person.id) == person
+    with pytest.raises(LookupError):
+        repository.get_person(added.id)
+
+
+def test_atomic_commits_once_for_nested_blocks(repository):
+    with repository.atomic():
+        repository.add_person("Bob", "bob@example.com", None)
+        with repository.atomic():
+            repository.add_milestone("Nested")
+    assert [p.name for p in repository.get_all_persons()] == ["Bob"]
+    assert [m.name for m in repository.get_all_milestones()] == ["Nested"]
+
+
+def test_add_persons_rolls_back_on_duplicate_email(repository, person):
+    with pytest.raises(sqlite3.Error):
+        repository.add_persons([("Bob", "bob@example.com", None), ("Ann 2", person.email, None)])
+    assert repository.get_all_persons() == [person]
+
+
+def test_delete_forgets_cached_foreign_keys(repository, person):
+    repository.add_task(*task_row(person.id))  # Confirms, and caches, the person as a foreign key target
+    repository.delete_person(person.id)
+    with pytest.raises(LookupError):
+        repository.add_task(*task_row(person.id))
+
+
+@pytest.mark.parametrize("returning", [True, False])
+def test_insert_returns_stored_ids(repository, returning):
+    if returning and not ProjectManagementRepository.RETURNING_SUPPORTED:
+        pytest.skip("INSERT ... RETURNING needs SQLite 3.35+")
+    repository.RETURNING_SUPPORTED = returning
+    repository.MAX_SQL_PARAMS = 7  # Two persons per multi-row INSERT, so the ids span several statements
+    first = repository.add_person("Ann", "ann@example.com", None)
+    batch = repository.add_persons([(f"P{i}", f"p{i}@example.com", "Dev") for i in range(5)])
+    last = repository.add_person("Zed", "zed@example.com", "QA")
+    added = [first, *batch, last]
+    assert len({p.id for p in added}) == len(added)
+    assert repository.get_all_persons(sort_by="id") == added
+    assert repository.get_persons([p.id for p in added]) == added
+
+
+@pytest.mark.parametrize("table", ["Person", "Milestone", "Task"])
+def test_delete_raises_for_a_row_removed_by_another_writer(repository, person, milestone, tmp_path, table):
+    task = repository.add_task(*task_row(person.id, milestone.id))  # Caches person and milestone as foreign keys
+    repository.get_task(task.id)
+    entity_id = {"Person": person.id, "Milestone": milestone.id, "Task": task.id}[table]
+    with closing(sqlite3.connect(str(tmp_path / "test.db"))) as conn:
+        conn.execute(f"DELETE FROM {table} WHERE id = ?", (entity_id,))
+        conn.commit()
+    with pytest.raises(LookupError):
+        getattr(repository, f"delete_{table.lower()}")(entity_id)
+
+
+@pytest.mark.parametrize("entity", ["persons", "milestones", "tasks"])
+def test_batch_delete_is_all_or_nothing(repository, person, milestone, entity):
+    task = repository.add_task(*task_row(person.id, milestone.id))
+    existing = {"persons": person.id, "milestones": milestone.id, "tasks": task.id}[entity]
+    delete = getattr(repository, f"delete_{entity}")
+    get_all = getattr(repository, f"get_all_{entity}")
+    with pytest.raises(LookupError, match="999"):
+        delete([existing, 999])
+    assert [e.id for e in get_all()] == [existing]
+    delete([existing, existing])  # Duplicates are deleted once
+    assert get_all() == []
+
+
+def test_batch_delete_spans_several_statements(repository):
+    repository.MAX_SQL_PARAMS = 3
+    persons = repository.add_persons([(f"P{i}", f"p{i}@example.com", None) for i in range(10)])
+    repository.delete_persons([p.id for p in persons[:7]])
+    assert [p.id for p in repository.get_all_persons(sort_by="id")] == [p.id for p in persons[7:]]
+
+
+def test_batch_delete_invalidates_cached_entities(repository, person, milestone):
+    task = repository.add_task(*task_row(person.id, milestone.id))
+    repository.get_task(task.id)
+    repository.delete_milestones([milestone.id])
+    assert repository.get_task(task.id).milestone_id is None  # ON DELETE SET NULL
+    repository.delete_persons([person.id])
+    with pytest.raises(LookupError):
+        repository.get_task(task.id)  # ON DELETE CASCADE
+    with pytest.raises(LookupError):
+        repository.add_task(*task_row(person.id))  # The foreign key cache forgot the deleted person
+
+
+def test_update_invalidates_cached_entities(repository, person, milestone):
+    task = repository.add_task(*task_row(person.id, milestone.id))
+    assert repository.get_person(person.id) == person  # Cache all three
+    assert repository.get_milestone(milestone.id) == milestone
+    assert repository.get_task(task.id) == task
+    repository.update_person(person.id, "Ann Renamed", person.email)
+    repository.update_milestone(milestone.id, name="Release 2")
+    repository.update_task(task.id, status="Done")
+    assert repository.get_person(person.id).name == "Ann Renamed"
+    assert repository.get_milestone(milestone.id).name == "Release 2"
+    assert repository.get_task(task.id).status == "Done"
+
+
+def test_delete_invalidates_cached_entities(repository, person, milestone):
+    linked = repository.add_task(*task_row(person.id, milestone.id))
+    other = repository.add_person("Bob", "bob@example.com", None)
+    owned = repository.add_task(*task_row(other.id))
+    for task in (linked, owned):
+        repository.get_task(task.id)
+    repository.get_person(other.id)
+    repository.delete_milestone(milestone.id)
+    assert repository.get_task(linked.id).milestone_id is None  # ON DELETE SET NULL
+    with pytest.raises(LookupError):
+        repository.get_milestone(milestone.id)
+    repository.delete_person(other.id)
+    for entity_id, get in ((other.id, repository.get_person), (owned.id, repository.get_task)):  # ON DELETE CASCADE
+        with pytest.raises(LookupError):
+            get(entity_id)
+
+
+def test_cache_miss_skips_entities_invalidated_while_loading(repository, person, monkeypatch):
+    fetch = repository._fetch_person
+
+    def fetch_then_update(person_id):
+        stale = fetch(person_id)
+        repository.update_person(person_id, "Ann Renamed", person.email)  # Lands while the miss is loading
+        return stale
+
+    monkeypatch.setattr(repository, "_fetch_person", fetch_then_update)
+    assert repository.get_person(person.id) == person
+    monkeypatch.setattr(repository, "_fetch_person", fetch)
+    assert repository.get_person(person.id).name == "Ann Renamed"
+
+
+def test_close_does_not_wait_forever_for_an_unfinished_iterator(repository, person):
+    persons = repository.iter_all_persons()
+    assert next(persons) == person  # Keeps a pooled reader borrowed
+    repository.CLOSE_TIMEOUT = 0.1
+    repository.close()
+    persons.close()  # The late reader is closed rather than pooled again
+    assert repository._readers.empty()
+    with pytest.raises(sqlite3.Error):
+        repository.get_all_persons()